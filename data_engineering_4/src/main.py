@@ -10,6 +10,8 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+import asyncio
+import contextlib
 import os
 import psycopg2
 from psycopg2.extras import RealDictCursor
@@ -31,6 +33,44 @@ except Exception as e:
     print(f"Warning: S3 storage not available: {e}")
 
 
+BUFFER_FLUSH_INTERVAL_SECONDS = 60
+_flush_task = None
+
+
+async def _flush_buffers_periodically():
+    """Upload closed per-minute reading batches in the background."""
+    while True:
+        await asyncio.sleep(BUFFER_FLUSH_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(storage_manager.flush_sensor_buffers)
+        except Exception as e:
+            print(f"Warning: failed to flush reading buffers: {e}")
+
+
+@app.on_event("startup")
+async def start_storage():
+    """Open the async S3 client and start the buffer flush loop."""
+    global _flush_task
+    if storage_manager:
+        await storage_manager.start_async_client()
+        _flush_task = asyncio.create_task(_flush_buffers_periodically())
+
+
+@app.on_event("shutdown")
+async def stop_storage():
+    """Flush buffered readings, then release the S3 clients and thread pools."""
+    if storage_manager:
+        if _flush_task:
+            _flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await _flush_task
+        try:
+            await asyncio.to_thread(storage_manager.flush_sensor_buffers, True)
+        finally:
+            await storage_manager.close_async_client()
+            storage_manager.close()
+
+
 class SensorReading(BaseModel):
     """Sensor reading model."""
     sensor_id: str
@@ -93,12 +133,17 @@ def health():
 
 
 @app.post("/ingest")
-def ingest(reading: SensorReading):
+async def ingest(
+    reading: SensorReading,
+    immediate: bool = Query(False, description="Upload now instead of batching per minute")
+):
     """
     Ingest sensor reading (stores to S3 for archival).
     
     Real-time data flows through Kafka → Spark → PostgreSQL.
-    This endpoint is for backup/archival to S3.
+    This endpoint is for backup/archival to S3. Readings are batched into
+    one NDJSON object per sensor type, city and minute unless
+    ``immediate`` is set (e.g. for alarms).
     """
     if not storage_manager:
         raise HTTPException(status_code=503, detail="Storage not available")
@@ -107,10 +152,15 @@ def ingest(reading: SensorReading):
         reading_dict = reading.dict()
         reading_dict["timestamp"] = reading.timestamp.isoformat()
         
-        key = storage_manager.upload_sensor_reading(reading_dict)
+        if immediate:
+            key = await storage_manager.upload_sensor_reading_async(reading_dict)
+            status = "stored"
+        else:
+            key = storage_manager.buffer_sensor_reading(reading_dict)
+            status = "buffered"
         
         return {
-            "status": "stored",
+            "status": status,
             "s3_key": key,
             "sensor_id": reading.sensor_id
         }
@@ -269,17 +319,26 @@ def storage_stats():
 @app.get("/storage/list")
 def list_stored_data(
     prefix: str = Query("", description="S3 key prefix filter"),
-    limit: int = Query(100, le=1000)
+    limit: int = Query(100, le=1000),
+    delimiter: Optional[str] = Query(None, description="List one level only, e.g. '/'")
 ):
     """List stored data in S3."""
     if not storage_manager:
         raise HTTPException(status_code=503, detail="Storage not available")
     
     try:
-        objects = storage_manager.list_objects(prefix=prefix, max_keys=limit)
+        listing = storage_manager.list_objects(
+            prefix=prefix, max_keys=limit, delimiter=delimiter
+        )
+        if delimiter:
+            return {
+                "count": len(listing["keys"]),
+                "objects": listing["keys"],
+                "prefixes": listing["prefixes"]
+            }
         return {
-            "count": len(objects),
-            "objects": objects
+            "count": len(listing),
+            "objects": listing
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -9,19 +9,52 @@ Generates realistic IoT sensor data for smart city applications:
 - Energy meters
 """
 
+import asyncio
 import json
 import random
 import time
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 import logging
 
+import numpy as np
 from kafka import KafkaProducer
 from kafka.errors import KafkaError
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional accelerator
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+RUSH_HOURS = (7, 8, 9, 16, 17, 18)
+TRAFFIC_METRICS = ("vehicle_count", "average_speed", "congestion_level")
+INTEGER_METRICS = ("vehicle_count", "occupied_spots", "total_spots")
+METRIC_BOUNDS = {
+    "congestion_level": (0.0, 10.0),
+    "humidity": (0.0, 100.0),
+    "power_factor": (0.0, 1.0),
+}
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _compute_metric_values(base_vec, u_matrix, clamp_mins, clamp_maxs, out):
+    """Apply random variation and clamping to an (n_readings, n_metrics) block."""
+    n, m = u_matrix.shape
+    for i in prange(n):
+        for j in range(m):
+            v = base_vec[j] * (1.0 + u_matrix[i, j])
+            out[i, j] = min(max(v, clamp_mins[j]), clamp_maxs[j])
+
 
 class SensorDataGenerator:
     """Generate realistic smart city sensor data."""
@@ -32,6 +65,9 @@ class SensorDataGenerator:
         "Ochota", "Ursynow", "Bielany", "Targowek", "Bemowo"
     ]
     
+    # Quality tags weighted 3:1:1 good/fair/poor
+    _QUALITY_TABLE = ("good", "good", "good", "fair", "poor")
+    
     SENSOR_TYPES = {
         "air_quality": {
             "metrics": ["pm25", "pm10", "no2", "co2", "temperature", "humidity"],
@@ -59,6 +95,7 @@ class SensorDataGenerator:
         """Initialize sensor data generator."""
         self.sensor_id_counter = 0
         self.base_values = self._initialize_base_values()
+        self.rng = np.random.default_rng()
     
     def _initialize_base_values(self) -> Dict[str, float]:
         """Initialize base values for realistic variation."""
@@ -140,24 +177,9 @@ class SensorDataGenerator:
         metrics = {}
         
         current_hour = datetime.utcnow().hour
-        is_rush_hour = current_hour in [7, 8, 9, 16, 17, 18]
-        is_night = current_hour >= 22 or current_hour <= 6
         
         for metric in sensor_config["metrics"]:
-            base = self.base_values.get(metric, 50.0)
-            
-            # Add time-based variation
-            if metric in ["vehicle_count", "average_speed", "congestion_level"]:
-                if is_rush_hour:
-                    base *= 1.8
-                elif is_night:
-                    base *= 0.3
-            
-            if metric in ["power_consumption"]:
-                if is_night:
-                    base *= 0.5
-                else:
-                    base *= 1.2
+            base = self._time_adjusted_base(metric, current_hour)
             
             # Add random variation
             variation = random.uniform(-0.15, 0.15)
@@ -184,10 +206,117 @@ class SensorDataGenerator:
             metrics[metric] = {
                 "value": value,
                 "unit": sensor_config["units"][metric],
-                "quality": random.choice(["good", "good", "good", "fair", "poor"])
+                "quality": self._QUALITY_TABLE[random.randint(0, 4)]
             }
         
         return metrics
+    
+    def _time_adjusted_base(self, metric: str, current_hour: int) -> float:
+        """Return the base value for a metric with time-of-day variation applied."""
+        base = self.base_values.get(metric, 50.0)
+        is_rush_hour = current_hour in RUSH_HOURS
+        is_night = current_hour >= 22 or current_hour <= 6
+        
+        if metric in TRAFFIC_METRICS:
+            if is_rush_hour:
+                base *= 1.8
+            elif is_night:
+                base *= 0.3
+        
+        if metric == "power_consumption":
+            base *= 0.5 if is_night else 1.2
+        
+        return base
+    
+    def generate_batch(self, n: int, sensor_type: str = None) -> List[Dict[str, Any]]:
+        """
+        Generate ``n`` sensor readings of one type in a single vectorized pass.
+        
+        Random draws are made in bulk with NumPy and the metric values are
+        computed by a compiled kernel; only the final dict packing is Python.
+        
+        Args:
+            n: Number of readings to generate
+            sensor_type: Type of sensor (if None, random)
+            
+        Returns:
+            List of sensor reading dictionaries
+        """
+        if sensor_type is None:
+            sensor_type = random.choice(list(self.SENSOR_TYPES.keys()))
+        
+        sensor_config = self.SENSOR_TYPES[sensor_type]
+        metric_names = sensor_config["metrics"]
+        units = sensor_config["units"]
+        m = len(metric_names)
+        rng = self.rng
+        
+        now = datetime.utcnow()
+        timestamp = now.isoformat()
+        
+        # Numeric kernel
+        base_vec = np.array(
+            [self._time_adjusted_base(metric, now.hour) for metric in metric_names]
+        )
+        clamp_mins = np.array([METRIC_BOUNDS.get(metric, (-np.inf, np.inf))[0] for metric in metric_names])
+        clamp_maxs = np.array([METRIC_BOUNDS.get(metric, (-np.inf, np.inf))[1] for metric in metric_names])
+        u_matrix = rng.uniform(-0.15, 0.15, size=(n, m))
+        values = np.empty((n, m))
+        _compute_metric_values(base_vec, u_matrix, clamp_mins, clamp_maxs, values)
+        
+        int_columns = [j for j, metric in enumerate(metric_names) if metric in INTEGER_METRICS]
+        values[:, int_columns] = np.trunc(values[:, int_columns])
+        if "occupancy_rate" in metric_names:
+            occupied = values[:, metric_names.index("occupied_spots")]
+            total = values[:, metric_names.index("total_spots")]
+            rate = np.divide(occupied, total, out=np.zeros(n), where=total > 0) * 100
+            values[:, metric_names.index("occupancy_rate")] = np.round(rate, 1)
+        values = np.round(values, 2)
+        quality_idx = rng.integers(0, len(self._QUALITY_TABLE), size=(n, m))
+        qualities = np.take(np.array(self._QUALITY_TABLE), quality_idx).tolist()
+        
+        # Per-reading attributes
+        cities = rng.choice(self.CITIES, size=n)
+        districts = rng.choice(self.DISTRICTS, size=n)
+        lats = np.round(52.2297 + rng.uniform(-0.15, 0.15, size=n), 6)
+        lons = np.round(21.0122 + rng.uniform(-0.15, 0.15, size=n), 6)
+        battery = np.round(rng.uniform(20, 100, size=n), 1)
+        signal = np.round(rng.uniform(-90, -30, size=n), 1)
+        firmware = rng.integers((1, 0, 0), (4, 10, 21), size=(n, 3))
+        calibration_days = rng.integers(1, 91, size=n)
+        
+        # Dict packing
+        readings = []
+        rows = values.tolist()
+        for i in range(n):
+            self.sensor_id_counter += 1
+            row = rows[i]
+            metrics = {}
+            for j, metric in enumerate(metric_names):
+                value = int(row[j]) if metric in INTEGER_METRICS else row[j]
+                metrics[metric] = {
+                    "value": value,
+                    "unit": units[metric],
+                    "quality": qualities[i][j]
+                }
+            major, minor, patch = firmware[i].tolist()
+            readings.append({
+                "sensor_id": f"{sensor_type.upper()}-{self.sensor_id_counter:06d}",
+                "sensor_type": sensor_type,
+                "city": str(cities[i]),
+                "district": str(districts[i]),
+                "location": {"lat": float(lats[i]), "lon": float(lons[i])},
+                "timestamp": timestamp,
+                "metrics": metrics,
+                "metadata": {
+                    "battery_level": float(battery[i]),
+                    "signal_strength": float(signal[i]),
+                    "firmware_version": f"v{major}.{minor}.{patch}",
+                    "last_calibration": (now - timedelta(days=int(calibration_days[i]))).isoformat()
+                }
+            })
+        
+        return readings
 
 
 class SensorKafkaProducer:
@@ -300,6 +429,140 @@ class SensorKafkaProducer:
         self.producer.close()
 
 
+class AsyncSensorKafkaProducer:
+    """Asyncio Kafka producer that overlaps data generation with network I/O."""
+    
+    def __init__(
+        self,
+        bootstrap_servers: str = "localhost:9092",
+        topic: str = "smart-city-sensors",
+        tick_seconds: float = 0.1,
+        queue_size: int = 10000
+    ):
+        """
+        Initialize async Kafka producer for sensors.
+        
+        Args:
+            bootstrap_servers: Kafka bootstrap servers
+            topic: Kafka topic
+            tick_seconds: Interval at which a batch of readings is generated
+            queue_size: Maximum readings buffered between generator and sender
+        """
+        self.bootstrap_servers = bootstrap_servers
+        self.topic = topic
+        self.tick_seconds = tick_seconds
+        self.queue_size = queue_size
+        self.generator = SensorDataGenerator()
+    
+    def _generate_tick(
+        self,
+        batch_n: int,
+        sensor_distribution: Dict[str, float]
+    ) -> List[Dict[str, Any]]:
+        """Generate one tick worth of readings following the type distribution."""
+        sensor_types = random.choices(
+            list(sensor_distribution.keys()),
+            weights=list(sensor_distribution.values()),
+            k=batch_n
+        )
+        readings = []
+        for sensor_type, n in Counter(sensor_types).items():
+            readings.extend(self.generator.generate_batch(n, sensor_type))
+        return readings
+    
+    async def produce_continuous(
+        self,
+        sensors_per_second: float = 10.0,
+        duration_seconds: int = None,
+        sensor_distribution: Dict[str, float] = None
+    ):
+        """
+        Continuously produce sensor readings.
+        
+        A generator task fills an ``asyncio.Queue`` on a drift-corrected
+        schedule while a sender task drains it into the Kafka producer.
+        
+        Args:
+            sensors_per_second: Rate of sensor reading generation
+            duration_seconds: Duration to run (None = infinite)
+            sensor_distribution: Distribution of sensor types (default: equal)
+        """
+        if sensor_distribution is None:
+            sensor_types = list(SensorDataGenerator.SENSOR_TYPES.keys())
+            sensor_distribution = {st: 1.0 / len(sensor_types) for st in sensor_types}
+        
+        logger.info(f"Starting async sensor production at {sensors_per_second} readings/sec")
+        logger.info(f"Sensor distribution: {sensor_distribution}")
+        
+        # Imported here so the sync generator and producer work without aiokafka
+        from aiokafka import AIOKafkaProducer
+        
+        producer = AIOKafkaProducer(
+            bootstrap_servers=self.bootstrap_servers,
+            key_serializer=lambda k: k.encode('utf-8') if k else None,
+            value_serializer=lambda v: json.dumps(v).encode('utf-8'),
+            acks='all',
+            compression_type='lz4',
+            linger_ms=100
+        )
+        await producer.start()
+        logger.info(f"Async sensor Kafka producer started for topic: {self.topic}")
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        readings_sent = 0
+        
+        async def gen():
+            # Carry the fractional remainder so the long-run rate is exact
+            per_tick = sensors_per_second * self.tick_seconds
+            carry = 0.0
+            ticks = 0
+            try:
+                while True:
+                    carry += per_tick
+                    batch_n = int(carry)
+                    carry -= batch_n
+                    if batch_n:
+                        for reading in self._generate_tick(batch_n, sensor_distribution):
+                            await queue.put(reading)
+                    
+                    ticks += 1
+                    next_tick = start_time + ticks * self.tick_seconds
+                    if duration_seconds and next_tick - start_time >= duration_seconds:
+                        break
+                    await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            finally:
+                await queue.put(None)
+        
+        async def snd():
+            nonlocal readings_sent
+            while True:
+                reading = await queue.get()
+                if reading is None:
+                    break
+                key = f"{reading['city']}:{reading['sensor_type']}"
+                await producer.send(self.topic, key=key, value=reading)
+                readings_sent += 1
+                
+                if readings_sent % 100 == 0:
+                    logger.info(f"Sent {readings_sent} sensor readings")
+        
+        try:
+            await asyncio.gather(gen(), snd())
+        except asyncio.CancelledError:
+            logger.info("Producer stopped by user")
+        finally:
+            logger.info("Flushing and closing producer...")
+            await producer.stop()
+        
+        elapsed = loop.time() - start_time
+        logger.info(
+            f"Sent {readings_sent} readings in {elapsed:.2f} seconds "
+            f"({readings_sent/elapsed:.2f} readings/sec)"
+        )
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -331,15 +594,20 @@ def main():
     
     args = parser.parse_args()
     
-    producer = SensorKafkaProducer(
+    producer = AsyncSensorKafkaProducer(
         bootstrap_servers=args.bootstrap_servers,
         topic=args.topic
     )
     
-    producer.produce_continuous(
-        sensors_per_second=args.rate,
-        duration_seconds=args.duration
-    )
+    try:
+        asyncio.run(
+            producer.produce_continuous(
+                sensors_per_second=args.rate,
+                duration_seconds=args.duration
+            )
+        )
+    except KeyboardInterrupt:
+        logger.info("Producer stopped by user")
 
 
 if __name__ == "__main__":
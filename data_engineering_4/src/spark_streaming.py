@@ -14,12 +14,33 @@ from pyspark.sql.types import (
     StructType, StructField, StringType, DoubleType, TimestampType,
     IntegerType, MapType
 )
+from functools import lru_cache
 import logging
 import os
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+JDBC_BATCH_SIZE = 10000
+JDBC_MAX_CONNECTIONS = 4
+JDBC_URL_PARAMS = {
+    "reWriteBatchedInserts": "true",
+    "prepareThreshold": "1",
+    "preparedStatementCacheQueries": "256",
+    "tcpKeepAlive": "true",
+}
+
+
+@lru_cache(maxsize=None)
+def _tuned_jdbc_url(jdbc_url: str) -> str:
+    """Append pgjdbc statement-cache, batching and keep-alive parameters to a JDBC URL."""
+    separator = "&" if "?" in jdbc_url else "?"
+    params = "&".join(
+        f"{name}={value}" for name, value in JDBC_URL_PARAMS.items()
+        if f"{name}=" not in jdbc_url
+    )
+    return f"{jdbc_url}{separator}{params}" if params else jdbc_url
+
 
 class SmartCitySensorProcessor:
     """Spark Streaming processor for smart city sensor data."""
@@ -30,7 +51,8 @@ class SmartCitySensorProcessor:
         kafka_bootstrap_servers: str = "localhost:9092",
         kafka_topic: str = "smart-city-sensors",
         checkpoint_location: str = "/tmp/spark-checkpoints",
-        output_mode: str = "append"
+        output_mode: str = "append",
+        trigger_interval: str = "30 seconds"
     ):
         """
         Initialize Spark Streaming processor.
@@ -41,11 +63,13 @@ class SmartCitySensorProcessor:
             kafka_topic: Kafka topic to consume
             checkpoint_location: Checkpoint directory
             output_mode: Output mode (append/update/complete)
+            trigger_interval: Processing-time trigger for the sink queries
         """
         self.kafka_bootstrap_servers = kafka_bootstrap_servers
         self.kafka_topic = kafka_topic
         self.checkpoint_location = checkpoint_location
         self.output_mode = output_mode
+        self.trigger_interval = trigger_interval
         
         # Initialize Spark session
         self.spark = SparkSession.builder \
@@ -56,6 +80,13 @@ class SmartCitySensorProcessor:
                    "org.apache.hadoop:hadoop-aws:3.3.4") \
             .config("spark.sql.streaming.checkpointLocation", checkpoint_location) \
             .config("spark.sql.adaptive.enabled", "true") \
+            .config("spark.sql.adaptive.coalescePartitions.enabled", "true") \
+            .config("spark.sql.adaptive.skewJoin.enabled", "true") \
+            .config("spark.sql.adaptive.advisoryPartitionSizeInBytes", "64m") \
+            .config("spark.sql.shuffle.partitions", "32") \
+            .config("spark.sql.streaming.statefulOperator.useStrictDistribution", "true") \
+            .config("spark.sql.streaming.stateStore.providerClass",
+                   "org.apache.spark.sql.execution.streaming.state.RocksDBStateStoreProvider") \
             .getOrCreate()
         
         self.spark.sparkContext.setLogLevel("WARN")
@@ -226,7 +257,9 @@ class SmartCitySensorProcessor:
     
     def write_to_postgres(self, df, table_name: str):
         """Write stream to PostgreSQL."""
-        jdbc_url = os.getenv("JDBC_URL", "jdbc:postgresql://localhost:5432/smartcity")
+        jdbc_url = _tuned_jdbc_url(
+            os.getenv("JDBC_URL", "jdbc:postgresql://localhost:5432/smartcity")
+        )
         db_user = os.getenv("DB_USER", "postgres")
         db_password = os.getenv("DB_PASSWORD", "postgres")
         
@@ -238,14 +271,16 @@ class SmartCitySensorProcessor:
                 )
             ) \
             .option("checkpointLocation", f"{self.checkpoint_location}/{table_name}") \
+            .trigger(processingTime=self.trigger_interval) \
             .start()
         
         return query
     
     def _write_batch_to_postgres(self, batch_df, batch_id, table_name, jdbc_url, user, password):
         """Write a micro-batch to PostgreSQL."""
-        if batch_df.count() > 0:
-            logger.info(f"Writing batch {batch_id} to {table_name}: {batch_df.count()} records")
+        record_count = batch_df.count()
+        if record_count > 0:
+            logger.info(f"Writing batch {batch_id} to {table_name}: {record_count} records")
             
             batch_df.write \
                 .format("jdbc") \
@@ -254,10 +289,18 @@ class SmartCitySensorProcessor:
                 .option("user", user) \
                 .option("password", password) \
                 .option("driver", "org.postgresql.Driver") \
+                .option("batchsize", str(JDBC_BATCH_SIZE)) \
+                .option("numPartitions", str(JDBC_MAX_CONNECTIONS)) \
                 .mode("append") \
                 .save()
     
-    def write_to_s3(self, df, s3_path: str, partition_cols: list = None):
+    def write_to_s3(
+        self,
+        df,
+        s3_path: str,
+        partition_cols: list = None,
+        checkpoint_name: str = "s3"
+    ):
         """Write stream to S3 in Parquet format."""
         if partition_cols is None:
             partition_cols = ["city", "aggregation_type"]
@@ -266,8 +309,9 @@ class SmartCitySensorProcessor:
             .outputMode(self.output_mode) \
             .format("parquet") \
             .option("path", s3_path) \
-            .option("checkpointLocation", f"{self.checkpoint_location}/s3") \
+            .option("checkpointLocation", f"{self.checkpoint_location}/{checkpoint_name}") \
             .partitionBy(*partition_cols) \
+            .trigger(processingTime=self.trigger_interval) \
             .start()
         
         return query
@@ -278,6 +322,7 @@ class SmartCitySensorProcessor:
             .outputMode(output_mode) \
             .format("console") \
             .option("truncate", "false") \
+            .trigger(processingTime="5 seconds") \
             .start()
         
         return query
@@ -302,8 +347,20 @@ class SmartCitySensorProcessor:
         # Optionally write to S3 (if configured)
         s3_path = os.getenv("S3_OUTPUT_PATH")
         if s3_path:
-            all_agg = air_quality_agg.union(traffic_agg).union(energy_agg)
-            query4 = self.write_to_s3(all_agg, s3_path)
+            # One sink per sensor type: the aggregations have different
+            # columns, so a union would null-pad every row.
+            s3_sinks = {
+                "air_quality": air_quality_agg,
+                "traffic": traffic_agg,
+                "energy": energy_agg,
+            }
+            for aggregation_type, agg_df in s3_sinks.items():
+                self.write_to_s3(
+                    agg_df,
+                    f"{s3_path.rstrip('/')}/{aggregation_type}/",
+                    partition_cols=["city"],
+                    checkpoint_name=f"s3_{aggregation_type}"
+                )
         
         # Wait for termination
         logger.info("Streaming queries started. Waiting for termination...")
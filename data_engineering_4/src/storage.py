@@ -4,17 +4,107 @@ Storage abstraction layer for S3/MinIO.
 Handles data persistence to object storage for archival and analytics.
 """
 
+import aioboto3
+from aiobotocore.config import AioConfig
 import boto3
+import ciso8601
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
-import json
+import asyncio
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import AsyncExitStack
+from functools import lru_cache
+import hashlib
+import io
 import logging
-from datetime import datetime
-from typing import Dict, Any, List,  Optional
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any, List,  Optional, Set, Union
 import os
 
+import orjson
+import zstandard
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+KEY_HASH_BYTES = 1
+LIST_PAGE_SIZE = 1000
+ZSTD_LEVEL = 3
+BUFFER_FLUSH_BYTES = 5 * 1024 * 1024
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+# Directory under an aggregation prefix holding the double-written copies
+MIRROR_DIR = "mirror"
+MULTIPART_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_THRESHOLD,
+    max_concurrency=10,
+    use_threads=True
+)
+
+
+PARTITION_TEMPLATE = (
+    "{prefix}/h={key_hash}/sensor_type={sensor_type}/city={city}/"
+    "year={year}/month={month:02d}/day={day:02d}/hour={hour:02d}/"
+)
+
+
+@lru_cache(maxsize=65536)
+def _key_hash(value: str) -> str:
+    """Short blake2b hash used as the leading key partition."""
+    return hashlib.blake2b(value.encode(), digest_size=KEY_HASH_BYTES).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _partition_prefix(
+    prefix: str,
+    key_hash: str,
+    sensor_type: str,
+    city: str,
+    year: int,
+    month: int,
+    day: int,
+    hour: int
+) -> str:
+    """Format the hour-level partition path; repeated within an hour of ingest."""
+    return PARTITION_TEMPLATE.format(
+        prefix=prefix,
+        key_hash=key_hash,
+        sensor_type=sensor_type,
+        city=city,
+        year=year,
+        month=month,
+        day=day,
+        hour=hour
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_client(endpoint_url: str, access_key: str, secret_key: str, region: str):
+    """
+    Return a shared, tuned S3 client for the given endpoint and credentials.
+    
+    boto3 clients (unlike resources) are thread-safe, so one client is
+    reused across storage managers and worker threads to keep its
+    connection pool and TLS sessions warm.
+    """
+    return boto3.client(
+        's3',
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+        config=Config(
+            max_pool_connections=64,
+            tcp_keepalive=True,
+            retries={'max_attempts': 5, 'mode': 'adaptive'},
+            s3={'addressing_style': 'path'}
+        )
+    )
+
 
 class S3StorageManager:
     """Manage S3/MinIO storage for sensor data."""
@@ -25,7 +115,8 @@ class S3StorageManager:
         access_key: str = None,
         secret_key: str = None,
         bucket_name: str = "smart-city-data",
-        region: str = "us-east-1"
+        region: str = "us-east-1",
+        max_workers: int = 32
     ):
         """
         Initialize S3 storage manager.
@@ -36,6 +127,7 @@ class S3StorageManager:
             secret_key: AWS secret key
             bucket_name: S3 bucket name
             region: AWS region
+            max_workers: Thread pool size for concurrent uploads
         """
         self.bucket_name = bucket_name
         
@@ -48,13 +140,33 @@ class S3StorageManager:
             endpoint_url = os.getenv("S3_ENDPOINT_URL", "http://localhost:9000")
         
         # Initialize S3 client
-        self.s3_client = boto3.client(
-            's3',
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region
-        )
+        self.s3_client = _make_client(endpoint_url, access_key, secret_key, region)
+        self._client_kwargs = {
+            'endpoint_url': endpoint_url,
+            'aws_access_key_id': access_key,
+            'aws_secret_access_key': secret_key,
+            'region_name': region
+        }
+        
+        # zstd (de)compressors must not be shared between threads
+        self._zstd = threading.local()
+        
+        # Per-(prefix, sensor_type, city, minute) NDJSON buffers
+        self._buffer: Dict[tuple, List[bytes]] = defaultdict(list)
+        self._buffer_bytes: Dict[tuple, int] = defaultdict(int)
+        self._buffer_keys: Dict[tuple, str] = {}
+        self._buffer_lock = threading.Lock()
+        # Batch uploads still in flight, guarded by _buffer_lock
+        self._pending_batches: Set[Future] = set()
+        
+        # Long-lived aiobotocore client, opened by start_async_client()
+        self._async_client = None
+        self._async_exit_stack = None
+        
+        # boto3 clients are thread-safe, so workers share the client above
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Separate pool for list-page prefetches issued from _executor tasks
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=max_workers)
         
         logger.info(f"S3 storage manager initialized for bucket: {bucket_name}")
         
@@ -89,40 +201,312 @@ class S3StorageManager:
         Returns:
             S3 key of uploaded object
         """
-        # Build S3 key with partitioning
-        timestamp = datetime.fromisoformat(reading["timestamp"].replace('Z', '+00:00'))
-        sensor_type = reading["sensor_type"]
-        city = reading["city"]
+        key = self._sensor_reading_key(reading, prefix)
         
-        key = (
-           f"{prefix}/"
-            f"sensor_type={sensor_type}/"
-            f"city={city}/"
-            f"year={timestamp.year}/"
-            f"month={timestamp.month:02d}/"
-            f"day={timestamp.day:02d}/"
-            f"hour={timestamp.hour:02d}/"
-            f"{reading['sensor_id']}_{timestamp.isoformat()}.json"
+        try:
+            self.s3_client.put_object(**self._sensor_reading_put_args(reading, key))
+            logger.debug(f"Uploaded reading to: s3://{self.bucket_name}/{key}")
+            return key
+        except ClientError as e:
+            logger.error(f"Failed to upload reading: {e}")
+            raise
+    
+    def buffer_sensor_reading(
+        self,
+        reading: Dict[str, Any],
+        prefix: str = "raw-data"
+    ) -> str:
+        """
+        Buffer a sensor reading for a per-minute NDJSON batch upload.
+        
+        Readings are grouped by sensor type, city and minute. A group is
+        uploaded as one object when it exceeds ``BUFFER_FLUSH_BYTES`` or
+        when ``flush_sensor_buffers`` runs after its minute has closed.
+        
+        Args:
+            reading: Sensor reading dictionary
+            prefix: S3 key prefix
+            
+        Returns:
+            S3 key of the batch object the reading will be written to
+        """
+        timestamp = self._parse_timestamp(reading["timestamp"])
+        group = (
+            prefix,
+            reading["sensor_type"],
+            reading["city"],
+            timestamp.replace(second=0, microsecond=0)
         )
+        line = orjson.dumps(reading) + b"\n"
+        
+        with self._buffer_lock:
+            key = self._buffer_keys.get(group)
+            if key is None:
+                key = self._buffer_keys[group] = self._batch_key(*group)
+            self._buffer[group].append(line)
+            self._buffer_bytes[group] += len(line)
+            batch = self._pop_buffer(group) if self._buffer_bytes[group] >= BUFFER_FLUSH_BYTES else None
+        
+        if batch:
+            # Upload in the background so buffering never blocks the caller
+            self._submit_batch(group, *batch)
+        return key
+    
+    def flush_sensor_buffers(self, force: bool = False) -> List[str]:
+        """
+        Upload buffered reading batches.
+        
+        Background uploads started by ``buffer_sensor_reading`` are waited
+        for first, so batches they failed to write are retried here. Lines
+        of a failed upload are put back in the buffer before the error is
+        raised.
+        
+        Args:
+            force: Flush every buffer, including the current minute's
+            
+        Returns:
+            S3 keys of uploaded batch objects
+        """
+        with self._buffer_lock:
+            pending = list(self._pending_batches)
+        wait(pending)
+        
+        current_minute = datetime.utcnow().replace(second=0, microsecond=0)
+        with self._buffer_lock:
+            groups = [
+                group for group in self._buffer
+                if force or group[3] < current_minute
+            ]
+            batches = [(group,) + self._pop_buffer(group) for group in groups]
+        
+        futures = [self._submit_batch(*batch) for batch in batches]
+        wait(futures)
+        keys = [future.result() for future in futures if future.exception() is None]
+        if keys:
+            logger.info(f"Flushed {len(keys)} reading batches to S3")
+        for future in futures:
+            if future.exception() is not None:
+                raise future.exception()
+        return keys
+    
+    def _pop_buffer(self, group: tuple):
+        """Remove a buffer group and return its (key, lines). Caller holds the lock."""
+        self._buffer_bytes.pop(group, None)
+        return self._buffer_keys.pop(group), self._buffer.pop(group)
+    
+    def _submit_batch(self, group: tuple, key: str, lines: List[bytes]) -> Future:
+        """Upload a popped buffer group in the background, tracking the future."""
+        future = self._executor.submit(self._put_batch_or_requeue, group, key, lines)
+        with self._buffer_lock:
+            self._pending_batches.add(future)
+        future.add_done_callback(self._batch_done)
+        return future
+    
+    def _batch_done(self, future: Future) -> None:
+        """Forget a finished background upload."""
+        with self._buffer_lock:
+            self._pending_batches.discard(future)
+    
+    def _put_batch_or_requeue(self, group: tuple, key: str, lines: List[bytes]) -> str:
+        """
+        Upload a batch, putting its lines back in the buffer if that fails.
         
+        The requeue happens in the worker, before the future completes, so
+        anyone waiting on the future sees the lines already buffered again.
+        """
+        try:
+            return self._put_batch(key, lines)
+        except Exception as e:
+            with self._buffer_lock:
+                # Requeue ahead of anything buffered since, reusing the batch
+                # key unless the group has already started a new one
+                self._buffer_keys.setdefault(group, key)
+                self._buffer[group][:0] = lines
+                self._buffer_bytes[group] += sum(len(line) for line in lines)
+            logger.error(f"Requeued {len(lines)} readings after failed batch upload {key}: {e}")
+            raise
+    
+    def _put_batch(self, key: str, lines: List[bytes]) -> str:
+        """Upload buffered NDJSON lines as a single compressed object."""
         try:
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=key,
-                Body=json.dumps(reading),
-                ContentType='application/json',
-                Metadata={
-                    'sensor_id': reading['sensor_id'],
-                    'sensor_type': sensor_type,
-                    'city': city
-                }
+                Body=self._compress(b"".join(lines)),
+                ContentType='application/x-ndjson',
+                ContentEncoding='zstd',
+                Metadata={'record_count': str(len(lines))}
+            )
+            return key
+        except ClientError as e:
+            logger.error(f"Failed to upload reading batch {key}: {e}")
+            raise
+    
+    def _batch_key(self, prefix: str, sensor_type: str, city: str, minute: datetime) -> str:
+        """Build the partitioned S3 key for a per-minute reading batch."""
+        partition = _partition_prefix(
+            prefix,
+            _key_hash(f"{sensor_type}:{city}"),
+            sensor_type,
+            city,
+            minute.year,
+            minute.month,
+            minute.day,
+            minute.hour
+        )
+        
+        return f"{partition}batch_{minute:%Y%m%dT%H%M}_{uuid.uuid4().hex[:8]}.ndjson"
+    
+    @staticmethod
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp into a naive UTC datetime."""
+        timestamp = ciso8601.parse_datetime(value)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        return timestamp
+    
+    def _compress(self, body: bytes) -> bytes:
+        """Compress an object body with this thread's zstd compressor."""
+        compressor = getattr(self._zstd, 'compressor', None)
+        if compressor is None:
+            compressor = self._zstd.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        return compressor.compress(body)
+    
+    def _decompress(self, body: bytes) -> bytes:
+        """Decompress a zstd object body with this thread's decompressor."""
+        decompressor = getattr(self._zstd, 'decompressor', None)
+        if decompressor is None:
+            decompressor = self._zstd.decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(body)
+    
+    async def start_async_client(self) -> None:
+        """Open the shared async S3 client used by the async upload path."""
+        if self._async_client is not None:
+            return
+        
+        self._async_exit_stack = AsyncExitStack()
+        self._async_client = await self._async_exit_stack.enter_async_context(
+            aioboto3.Session().client(
+                's3',
+                config=AioConfig(max_pool_connections=64),
+                **self._client_kwargs
             )
+        )
+        logger.info("Async S3 client started")
+    
+    async def close_async_client(self) -> None:
+        """Close the async S3 client and its connection pool."""
+        if self._async_exit_stack is not None:
+            await self._async_exit_stack.aclose()
+        self._async_client = None
+        self._async_exit_stack = None
+    
+    def close(self) -> None:
+        """Wait for in-flight uploads and listings, then shut down the thread pools."""
+        self._executor.shutdown(wait=True)
+        self._prefetch_executor.shutdown(wait=True)
+    
+    async def upload_sensor_reading_async(
+        self,
+        reading: Dict[str, Any],
+        prefix: str = "raw-data"
+    ) -> str:
+        """
+        Upload a sensor reading to S3 without blocking the event loop.
+        
+        Falls back to the synchronous client in a worker thread when the
+        async client has not been started.
+        
+        Args:
+            reading: Sensor reading dictionary
+            prefix: S3 key prefix
+            
+        Returns:
+            S3 key of uploaded object
+        """
+        if self._async_client is None:
+            return await asyncio.to_thread(self.upload_sensor_reading, reading, prefix)
+        
+        key = self._sensor_reading_key(reading, prefix)
+        
+        try:
+            await self._async_client.put_object(**self._sensor_reading_put_args(reading, key))
             logger.debug(f"Uploaded reading to: s3://{self.bucket_name}/{key}")
             return key
         except ClientError as e:
             logger.error(f"Failed to upload reading: {e}")
             raise
     
+    def upload_sensor_readings(
+        self,
+        readings: List[Dict[str, Any]],
+        prefix: str = "raw-data"
+    ) -> List[str]:
+        """
+        Upload a batch of sensor readings to S3 concurrently.
+        
+        Args:
+            readings: Sensor reading dictionaries
+            prefix: S3 key prefix
+            
+        Returns:
+            S3 keys of uploaded objects, in input order
+        """
+        keys = [self._sensor_reading_key(reading, prefix) for reading in readings]
+        futures = {
+            self._executor.submit(
+                self.s3_client.put_object,
+                **self._sensor_reading_put_args(reading, key)
+            ): key
+            for reading, key in zip(readings, keys)
+        }
+        
+        errors = []
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except ClientError as e:
+                logger.error(f"Failed to upload reading {futures[future]}: {e}")
+                errors.append(e)
+        
+        if errors:
+            raise errors[0]
+        
+        logger.debug(f"Uploaded {len(keys)} readings to s3://{self.bucket_name}/{prefix}")
+        return keys
+    
+    def _sensor_reading_key(self, reading: Dict[str, Any], prefix: str) -> str:
+        """Build the partitioned S3 key for a sensor reading."""
+        timestamp = ciso8601.parse_datetime(reading["timestamp"])
+        # Leading hash partition spreads ingest bursts across S3 index partitions
+        partition = _partition_prefix(
+            prefix,
+            _key_hash(reading['sensor_id']),
+            reading['sensor_type'],
+            reading['city'],
+            timestamp.year,
+            timestamp.month,
+            timestamp.day,
+            timestamp.hour
+        )
+        
+        return f"{partition}{reading['sensor_id']}_{timestamp.isoformat()}.json"
+    
+    def _sensor_reading_put_args(self, reading: Dict[str, Any], key: str) -> Dict[str, Any]:
+        """Build put_object arguments for a sensor reading."""
+        return {
+            'Bucket': self.bucket_name,
+            'Key': key,
+            'Body': self._compress(orjson.dumps(reading)),
+            'ContentType': 'application/json',
+            'ContentEncoding': 'zstd',
+            'Metadata': {
+                'sensor_id': reading['sensor_id'],
+                'sensor_type': reading['sensor_type'],
+                'city': reading['city']
+            }
+        }
+    
     def upload_aggregation(
         self,
         aggregation: Dict[str, Any],
@@ -152,56 +536,110 @@ class S3StorageManager:
             f"agg_{timestamp.isoformat()}.json"
         )
         
+        body = orjson.dumps(aggregation)
+        
+        # Write a mirror copy so readers can fall back to it while the
+        # primary is still subject to visibility tail latency
+        futures = [
+            self._executor.submit(self._put_aggregation_body, target_key, body)
+            for target_key in (key, self._mirror_key(key))
+        ]
+        
         try:
+            for future in futures:
+                future.result()
+            return key
+        except ClientError as e:
+            logger.error(f"Failed to upload aggregation: {e}")
+            raise
+    
+    def _put_aggregation_body(self, key: str, body: bytes) -> None:
+        """Upload a serialized aggregation body to ``key``."""
+        if len(body) > MULTIPART_THRESHOLD:
+            # Large rollups go through the transfer manager so parts upload in parallel
+            self.s3_client.upload_fileobj(
+                io.BytesIO(body),
+                self.bucket_name,
+                key,
+                ExtraArgs={'ContentType': 'application/json'},
+                Config=MULTIPART_TRANSFER_CONFIG
+            )
+        else:
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=key,
-                Body=json.dumps(aggregation),
+                Body=body,
                 ContentType='application/json'
             )
-            return key
-        except ClientError as e:
-            logger.error(f"Failed to upload aggregation: {e}")
-            raise
+    
+    @staticmethod
+    def _mirror_key(key: str) -> str:
+        """Return the mirror key for a double-written object."""
+        prefix, _, rest = key.partition('/')
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        return f"{prefix}/{MIRROR_DIR}/{digest}/{rest.rsplit('/', 1)[-1]}"
+    
+    @staticmethod
+    def _is_mirrored(key: str) -> bool:
+        """Whether ``key`` is double-written (only aggregation keys are)."""
+        return key.partition('/')[2].startswith('type=')
+    
+    @staticmethod
+    def _is_mirror_copy(key: str) -> bool:
+        """Whether ``key`` (or prefix) lies inside a mirror directory."""
+        parts = key.split('/', 2)
+        return len(parts) > 2 and parts[1] == MIRROR_DIR
     
     def list_objects(
         self,
         prefix: str = "",
-        max_keys: int = 100
-    ) -> List[Dict[str, Any]]:
+        max_keys: int = 100,
+        delimiter: Optional[str] = None
+    ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         List objects in bucket.
         
         Args:
             prefix: Key prefix filter
             max_keys: Maximum number of keys to return
+            delimiter: If set (e.g. "/"), list only the next hierarchy level
             
         Returns:
-            List of object metadata
+            List of object metadata, or with a delimiter a dict with the
+            level's ``keys`` and its sub-``prefixes``
         """
+        params = {
+            'Bucket': self.bucket_name,
+            'Prefix': prefix,
+            'MaxKeys': max_keys
+        }
+        if delimiter:
+            params['Delimiter'] = delimiter
+        
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=max_keys
-            )
-            
-            if 'Contents' not in response:
-                return []
+            response = self.s3_client.list_objects_v2(**params)
             
-            return [
+            objects = [
                 {
                     'key': obj['Key'],
                     'size': obj['Size'],
                     'last_modified': obj['LastModified'].isoformat()
                 }
-                for obj in response['Contents']
+                for obj in response.get('Contents', [])
             ]
+            
+            if not delimiter:
+                return objects
+            
+            return {
+                'keys': objects,
+                'prefixes': [cp['Prefix'] for cp in response.get('CommonPrefixes', [])]
+            }
         except ClientError as e:
             logger.error(f"Failed to list objects: {e}")
             raise
     
-    def download_object(self, key: str) -> Dict[str, Any]:
+    def download_object(self, key: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Download and parse JSON object from S3.
         
@@ -209,14 +647,31 @@ class S3StorageManager:
             key: S3 object key
             
         Returns:
-            Parsed JSON data
+            Parsed JSON data (a list of records for .ndjson batches)
         """
         try:
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=key
-            )
-            data = json.loads(response['Body'].read().decode('utf-8'))
+            try:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=key
+                )
+            except ClientError as e:
+                if (
+                    e.response.get('Error', {}).get('Code') != 'NoSuchKey'
+                    or not self._is_mirrored(key)
+                ):
+                    raise
+                # Primary not visible yet; try the double-written mirror
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=self._mirror_key(key)
+                )
+            body = response['Body'].read()
+            if response.get('ContentEncoding') == 'zstd':
+                body = self._decompress(body)
+            if key.endswith('.ndjson'):
+                return [orjson.loads(line) for line in body.splitlines() if line]
+            data = orjson.loads(body)
             return data
         except ClientError as e:
             logger.error(f"Failed to download object: {e}")
@@ -233,35 +688,50 @@ class S3StorageManager:
             True if successful
         """
         try:
-            self.s3_client.delete_object(
-                Bucket=self.bucket_name,
-                Key=key
-            )
+            targets = (key, self._mirror_key(key)) if self._is_mirrored(key) else (key,)
+            for target_key in targets:
+                self.s3_client.delete_object(
+                    Bucket=self.bucket_name,
+                    Key=target_key
+                )
             logger.info(f"Deleted object: {key}")
             return True
         except ClientError as e:
             logger.error(f"Failed to delete object: {e}")
             return False
     
-    def get_bucket_stats(self) -> Dict[str, Any]:
+    def get_bucket_stats(self, fan_out_depth: int = 2) -> Dict[str, Any]:
         """
         Get bucket statistics.
         
+        The partition tree is expanded ``fan_out_depth`` levels using
+        delimiter listings, then every resulting prefix is listed
+        concurrently. Mirror copies of aggregations are not counted.
+        
+        Args:
+            fan_out_depth: Number of prefix levels to expand before listing
+            
         Returns:
             Statistics dictionary
         """
         try:
-            # Count objects and total size
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name)
-            
             total_objects = 0
             total_size = 0
+            prefixes = [""]
+            
+            for _ in range(fan_out_depth):
+                next_prefixes = []
+                for objects, common_prefixes in self._executor.map(self._list_level, prefixes):
+                    total_objects += len(objects)
+                    total_size += sum(obj['Size'] for obj in objects)
+                    next_prefixes.extend(common_prefixes)
+                prefixes = next_prefixes
+                if not prefixes:
+                    break
             
-            for page in pages:
-                if 'Contents' in page:
-                    total_objects += len(page['Contents'])
-                    total_size += sum(obj['Size'] for obj in page['Contents'])
+            for count, size in self._executor.map(self._prefix_totals, prefixes):
+                total_objects += count
+                total_size += size
             
             return {
                 'bucket_name': self.bucket_name,
@@ -272,3 +742,55 @@ class S3StorageManager:
         except ClientError as e:
             logger.error(f"Failed to get bucket stats: {e}")
             raise
+    
+    def _list_level(self, prefix: str):
+        """List objects and sub-prefixes directly under ``prefix``."""
+        objects = []
+        common_prefixes = []
+        for page in self._iter_list_pages(Prefix=prefix, Delimiter='/'):
+            objects.extend(page.get('Contents', []))
+            common_prefixes.extend(
+                p['Prefix'] for p in page.get('CommonPrefixes', [])
+                if not self._is_mirror_copy(p['Prefix'])
+            )
+        return objects, common_prefixes
+    
+    def _prefix_totals(self, prefix: str):
+        """Count objects and bytes under ``prefix``."""
+        count = 0
+        size = 0
+        # Prefixes above the mirror directory also contain mirror copies
+        skip_mirrors = '/' not in prefix.rstrip('/')
+        for page in self._iter_list_pages(Prefix=prefix):
+            if skip_mirrors:
+                contents = [
+                    obj for obj in page.get('Contents', ())
+                    if not self._is_mirror_copy(obj['Key'])
+                ]
+                count += len(contents)
+            else:
+                contents = page.get('Contents', ())
+                # Without a delimiter KeyCount is exactly the number of objects
+                count += page.get('KeyCount', 0)
+            size += sum(obj['Size'] for obj in contents)
+        return count, size
+    
+    def _iter_list_pages(self, **params):
+        """
+        Yield list_objects_v2 pages, requesting the next page before the
+        current one is handed to the caller so processing overlaps the
+        following round-trip.
+        """
+        def fetch(token=None):
+            # Ask for the maximum page size to minimize round-trips
+            request = dict(params, Bucket=self.bucket_name, MaxKeys=LIST_PAGE_SIZE)
+            if token:
+                request['ContinuationToken'] = token
+            return self.s3_client.list_objects_v2(**request)
+        
+        future = self._prefetch_executor.submit(fetch)
+        while future is not None:
+            page = future.result()
+            token = page.get('NextContinuationToken') if page.get('IsTruncated') else None
+            future = self._prefetch_executor.submit(fetch, token) if token else None
+            yield page
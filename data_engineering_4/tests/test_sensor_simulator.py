@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.sensor_simulator import (
+    METRIC_BOUNDS,
+    INTEGER_METRICS,
+    SensorDataGenerator,
+    _compute_metric_values,
+)
+
+
+@pytest.mark.parametrize("sensor_type", list(SensorDataGenerator.SENSOR_TYPES))
+def test_generate_batch_shape_and_ranges(sensor_type):
+    generator = SensorDataGenerator()
+    readings = generator.generate_batch(200, sensor_type)
+    metric_names = SensorDataGenerator.SENSOR_TYPES[sensor_type]["metrics"]
+
+    assert len(readings) == 200
+    assert len({r["sensor_id"] for r in readings}) == 200
+    for reading in readings:
+        assert reading["sensor_type"] == sensor_type
+        assert reading["city"] in SensorDataGenerator.CITIES
+        assert reading["district"] in SensorDataGenerator.DISTRICTS
+        assert abs(reading["location"]["lat"] - 52.2297) <= 0.15
+        assert abs(reading["location"]["lon"] - 21.0122) <= 0.15
+        assert 20 <= reading["metadata"]["battery_level"] <= 100
+        assert list(reading["metrics"]) == metric_names
+        for metric, entry in reading["metrics"].items():
+            assert entry["quality"] in ("good", "fair", "poor")
+            if metric in INTEGER_METRICS:
+                assert isinstance(entry["value"], int)
+            else:
+                assert isinstance(entry["value"], float)
+            low, high = METRIC_BOUNDS.get(metric, (-np.inf, np.inf))
+            assert low <= entry["value"] <= high
+
+
+def test_generate_batch_occupancy_rate_matches_spots():
+    readings = SensorDataGenerator().generate_batch(50, "parking")
+    for reading in readings:
+        metrics = reading["metrics"]
+        expected = metrics["occupied_spots"]["value"] / metrics["total_spots"]["value"] * 100
+        assert metrics["occupancy_rate"]["value"] == pytest.approx(expected, abs=0.051)
+
+
+def test_compute_metric_values_varies_and_clamps():
+    base = np.array([10.0, 0.9])
+    u = np.array([[0.1, 0.15], [-0.1, -0.15]])
+    out = np.empty((2, 2))
+    _compute_metric_values(base, u, np.array([-np.inf, 0.0]), np.array([np.inf, 1.0]), out)
+    assert np.allclose(out, [[11.0, 1.0], [9.0, 0.765]])
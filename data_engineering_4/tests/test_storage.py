@@ -0,0 +1,192 @@
+import io
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+import src.storage as storage
+from src.storage import S3StorageManager
+
+
+class FakeS3:
+    """In-memory stand-in for the subset of the S3 client the manager uses."""
+
+    def __init__(self):
+        self.objects = {}
+        self.fail_puts = 0
+
+    def head_bucket(self, Bucket):
+        return {}
+
+    def put_object(self, Bucket, Key, Body, ContentEncoding=None, **kwargs):
+        if self.fail_puts:
+            self.fail_puts -= 1
+            raise ClientError({"Error": {"Code": "InternalError"}}, "PutObject")
+        self.objects[Key] = (bytes(Body), ContentEncoding)
+        return {}
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        self.objects[key] = (fileobj.read(), None)
+
+    def get_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        body, encoding = self.objects[Key]
+        response = {"Body": io.BytesIO(body)}
+        if encoding:
+            response["ContentEncoding"] = encoding
+        return response
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+        return {}
+
+    def list_objects_v2(self, Bucket, Prefix="", MaxKeys=1000, Delimiter=None,
+                        ContinuationToken=None):
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        prefixes = []
+        if Delimiter:
+            direct = []
+            for key in keys:
+                head, sep, _ = key[len(Prefix):].partition(Delimiter)
+                if sep:
+                    if Prefix + head + sep not in prefixes:
+                        prefixes.append(Prefix + head + sep)
+                else:
+                    direct.append(key)
+            keys = direct
+        start = int(ContinuationToken or 0)
+        page = keys[start:start + MaxKeys]
+        response = {
+            "Contents": [
+                {"Key": k, "Size": len(self.objects[k][0]),
+                 "LastModified": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+                for k in page
+            ],
+            "CommonPrefixes": [{"Prefix": p} for p in prefixes],
+            "KeyCount": len(page),
+            "IsTruncated": start + MaxKeys < len(keys),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + MaxKeys)
+        return response
+
+
+@pytest.fixture
+def s3():
+    return FakeS3()
+
+
+@pytest.fixture
+def manager(s3):
+    with mock.patch.object(storage, "_make_client", return_value=s3):
+        yield S3StorageManager(max_workers=4)
+
+
+def _reading(i, timestamp="2024-01-01T12:00:05", city="Warsaw"):
+    return {
+        "sensor_id": f"AIR_QUALITY-{i:06d}",
+        "sensor_type": "air_quality",
+        "city": city,
+        "timestamp": timestamp,
+        "metrics": {"pm25": {"value": 20.0 + i, "unit": "ug/m3"}},
+    }
+
+
+def test_partition_key_layout(manager):
+    key = manager._sensor_reading_key(_reading(1), "raw-data")
+    assert key == (
+        f"raw-data/h={storage._key_hash('AIR_QUALITY-000001')}/sensor_type=air_quality/"
+        "city=Warsaw/year=2024/month=01/day=01/hour=12/"
+        "AIR_QUALITY-000001_2024-01-01T12:00:05.json"
+    )
+
+
+def test_upload_and_download_reading_round_trip(manager, s3):
+    key = manager.upload_sensor_reading(_reading(1))
+    assert s3.objects[key][1] == "zstd"
+    assert manager.download_object(key) == _reading(1)
+
+
+def test_buffer_flush_round_trip(manager, s3):
+    readings = [_reading(i) for i in range(5)]
+    keys = {manager.buffer_sensor_reading(r) for r in readings}
+    assert len(keys) == 1
+    assert s3.objects == {}
+
+    assert manager.flush_sensor_buffers() == list(keys)
+    assert manager.download_object(keys.pop()) == readings
+    assert manager.flush_sensor_buffers() == []
+
+
+def test_buffer_groups_by_city_and_minute(manager):
+    keys = {
+        manager.buffer_sensor_reading(_reading(0)),
+        manager.buffer_sensor_reading(_reading(1, city="Krakow")),
+        manager.buffer_sensor_reading(_reading(2, timestamp="2024-01-01T12:01:00")),
+        manager.buffer_sensor_reading(_reading(3, timestamp="2024-01-01T12:00:59")),
+    }
+    assert len(keys) == 3
+    assert sorted(manager.flush_sensor_buffers(force=True)) == sorted(keys)
+
+
+def test_full_buffer_uploads_in_background(manager, s3, monkeypatch):
+    monkeypatch.setattr(storage, "BUFFER_FLUSH_BYTES", 1)
+    key = manager.buffer_sensor_reading(_reading(1))
+    manager.flush_sensor_buffers()
+    assert manager.download_object(key) == [_reading(1)]
+
+
+def test_failed_batch_upload_is_requeued(manager, s3, monkeypatch):
+    monkeypatch.setattr(storage, "BUFFER_FLUSH_BYTES", 1)
+    s3.fail_puts = 2
+    key = manager.buffer_sensor_reading(_reading(1))
+
+    with pytest.raises(ClientError):
+        manager.flush_sensor_buffers()
+    assert s3.objects == {}
+
+    assert manager.flush_sensor_buffers() == [key]
+    assert manager.download_object(key) == [_reading(1)]
+
+
+def test_large_aggregation_uses_multipart(manager, s3, monkeypatch):
+    monkeypatch.setattr(storage, "MULTIPART_THRESHOLD", 16)
+    aggregation = {"aggregation_type": "hourly", "city": "Warsaw", "values": list(range(100))}
+    with mock.patch.object(s3, "upload_fileobj", wraps=s3.upload_fileobj) as upload, \
+            mock.patch.object(s3, "put_object", wraps=s3.put_object) as put:
+        key = manager.upload_aggregation(aggregation)
+    assert upload.called
+    assert not put.called
+    assert manager.download_object(key) == aggregation
+
+
+def test_aggregation_mirror_fallback_and_delete(manager, s3):
+    aggregation = {"aggregation_type": "hourly", "city": "Warsaw"}
+    key = manager.upload_aggregation(aggregation)
+    assert len(s3.objects) == 2
+
+    del s3.objects[key]
+    assert manager.download_object(key) == aggregation
+    assert manager.delete_object(key)
+    assert s3.objects == {}
+
+
+def test_bucket_stats_skips_mirrors(manager, s3):
+    manager.upload_sensor_reading(_reading(1))
+    manager.upload_aggregation({"aggregation_type": "hourly", "city": "Warsaw"})
+
+    stats = manager.get_bucket_stats(fan_out_depth=1)
+    assert stats["total_objects"] == 2
+    assert len(s3.objects) == 3
+
+
+def test_bucket_stats_follows_prefetched_pages(manager, s3, monkeypatch):
+    monkeypatch.setattr(storage, "LIST_PAGE_SIZE", 2)
+    for i in range(5):
+        manager.upload_sensor_reading(_reading(i))
+
+    stats = manager.get_bucket_stats(fan_out_depth=1)
+    assert stats["total_objects"] == 5
+    assert stats["total_size_bytes"] == sum(len(body) for body, _ in s3.objects.values())
@@ -6,12 +6,13 @@ FastAPI server providing ML predictions for city quality of life scores.
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
-import pandas as pd
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+import numpy as np
 from pathlib import Path
 import logging
 
-from src.ml_pipeline import QualityOfLifePredictor
+from src.ml_pipeline import FEATURE_NAMES, QualityOfLifePredictor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,6 +36,13 @@ if model_path.exists():
         logger.warning(f"Failed to load model: {e}")
 
 
+@lru_cache(maxsize=4096)
+def _cached_predict(features: Tuple[float, ...]) -> float:
+    """Predict a single quality score, memoized on quantized features."""
+    row = np.asarray(features, dtype=np.float32).reshape(1, -1)
+    return float(predictor.predict_array(row)[0])
+
+
 class CityMetrics(BaseModel):
     """Input features for quality prediction."""
     cost_of_living_index: float = Field(..., ge=0, le=200, description="Cost of living index")
@@ -57,7 +65,7 @@ class PredictionResponse(BaseModel):
 class TrainingRequest(BaseModel):
     """Request to train/retrain model."""
     n_samples: int = Field(500, ge=100, le=10000)
-    model_type: str = Field("random_forest", regex="^(random_forest|gradient_boosting)$")
+    model_type: str = Field("random_forest", pattern="^(random_forest|gradient_boosting)$")
 
 
 @app.get("/")
@@ -101,11 +109,11 @@ def predict(metrics: CityMetrics):
         )
     
     try:
-        # Convert to DataFrame
-        input_df = pd.DataFrame([metrics.dict()])
+        # Quantize to one decimal so repeated dashboard queries hit the cache
+        features = tuple(round(getattr(metrics, name), 1) for name in FEATURE_NAMES)
         
         # Make prediction
-        prediction = predictor.predict(input_df)[0]
+        prediction = _cached_predict(features)
         
         return PredictionResponse(
             quality_score=round(float(prediction), 2),
@@ -139,11 +147,13 @@ def predict_batch(cities: List[CityMetrics]):
         )
     
     try:
-        # Convert to DataFrame
-        input_df = pd.DataFrame([city.dict() for city in cities])
+        # Build the feature matrix directly in model column order
+        features = np.empty((len(cities), len(FEATURE_NAMES)), dtype=np.float32)
+        for i, city in enumerate(cities):
+            features[i] = [getattr(city, name) for name in FEATURE_NAMES]
         
         # Make predictions
-        predictions = predictor.predict(input_df)
+        predictions = predictor.predict_array(features)
         
         return {
             "predictions": [
@@ -183,8 +193,9 @@ def train_model(request: TrainingRequest):
         
         # Save model
         model_path = predictor.save_model()
+        _cached_predict.cache_clear()
         
-       return {
+        return {
             "status": "success",
             "message": f"Model trained successfully",
             "model_path": str(model_path),
@@ -7,19 +7,51 @@ based on city metrics (cost of living, pollution, safety, etc.).
 
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.inspection import permutation_importance
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+from sklearn.pipeline import make_pipeline
 import joblib
 import logging
 from pathlib import Path
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, Union
 from datetime import datetime
 
+try:
+    import onnxruntime as ort
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+except ImportError:  # ONNX serving is optional; sklearn is used otherwise
+    ort = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+FEATURE_NAMES = [
+    'cost_of_living_index',
+    'rent_index',
+    'safety_index',
+    'health_care_index',
+    'pollution_index',
+    'climate_index',
+    'traffic_time_index',
+    'purchasing_power_index',
+]
+
+# Uniform sampling bounds for each feature in FEATURE_NAMES order
+SYNTHETIC_FEATURE_LOW = np.array([40, 15, 30, 40, 20, 50, 20, 30], dtype=float)
+SYNTHETIC_FEATURE_HIGH = np.array([120, 90, 90, 95, 100, 100, 150, 140], dtype=float)
+
+# quality = 0.25*safety + 0.20*health + 0.15*climate + 0.15*purchasing
+#           + 0.10*(100 - pollution) + 0.10*(100 - cost) + 0.05*(100 - traffic)
+QUALITY_WEIGHTS = np.array([-0.10, 0.0, 0.25, 0.20, -0.10, 0.15, -0.05, 0.15])
+QUALITY_INTERCEPT = 100 * (0.10 + 0.10 + 0.05)
+
+# Tree ensembles are invariant to feature scaling
+TREE_MODEL_TYPES = {'random_forest', 'gradient_boosting'}
+
 
 class QualityOfLifePredictor:
     """
@@ -27,7 +59,7 @@ class QualityOfLifePredictor:
     
     Features:
     - Data preprocessing and feature engineering
-    - Multiple model training (RandomForest, GradientBoosting)
+    - Multiple model training (RandomForest, HistGradientBoosting)
     - Model evaluation and comparison
     - Model persistence
     - Prediction API
@@ -47,6 +79,10 @@ class QualityOfLifePredictor:
         self.scaler = None
         self.feature_names = None
         self.model_metadata = {}
+        self._needs_scaling = True
+        self._onnx_session = None
+        self._mean = None
+        self._inv_scale = None
     
     def generate_synthetic_data(self, n_samples: int = 500) -> pd.DataFrame:
         """
@@ -58,40 +94,27 @@ class QualityOfLifePredictor:
         Returns:
             DataFrame with city metrics and quality scores
         """
-        np.random.seed(42)
-        
-        # Generate features
-        data = {
-            'cost_of_living_index': np.random.uniform(40, 120, n_samples),
-            'rent_index': np.random.uniform(15, 90, n_samples),
-            'safety_index': np.random.uniform(30, 90, n_samples),
-            'health_care_index': np.random.uniform(40, 95, n_samples),
-            'pollution_index': np.random.uniform(20, 100, n_samples),
-            ' climate_index': np.random.uniform(50, 100, n_samples),
-            'traffic_time_index': np.random.uniform(20, 150, n_samples),
-            'purchasing_power_index': np.random.uniform(30, 140, n_samples),
-        }
+        rng = np.random.default_rng(42)
         
-        df = pd.DataFrame(data)
+        # Generate all features with a single draw
+        X = rng.uniform(
+            SYNTHETIC_FEATURE_LOW, SYNTHETIC_FEATURE_HIGH,
+            size=(n_samples, len(FEATURE_NAMES))
+        )
         
         # Generate target (quality of life score)
         # Higher safety, healthcare, climate, purchasing power = higher quality
         # Lower cost, pollution, traffic = higher quality
-        quality_score = (
-            0.25 * df['safety_index'] +
-            0.20 * df['health_care_index'] +
-            0.15 * df['climate_index'] +
-            0.15 * df['purchasing_power_index'] +
-            0.10 * (100 - df['pollution_index']) +
-            0.10 * (100 - df['cost_of_living_index']) +
-            0.05 * (100 - df['traffic_time_index'])
-        )
+        quality_score = X @ QUALITY_WEIGHTS + QUALITY_INTERCEPT
         
         # Add some noise
-        quality_score += np.random.normal(0, 5, n_samples)
+        quality_score += rng.normal(0, 5, n_samples)
         quality_score = np.clip(quality_score, 0, 100)
         
-        df['quality_score'] = quality_score
+        df = pd.DataFrame(
+            np.column_stack([X, quality_score]),
+            columns=FEATURE_NAMES + ['quality_score']
+        )
         
         logger.info(f"Generated {n_samples} synthetic city records")
         return df
@@ -100,10 +123,13 @@ class QualityOfLifePredictor:
         self,
         df: pd.DataFrame,
         fit_scaler: bool = True
-    ) -> Tuple[pd.DataFrame, pd.Series]:
+    ) -> Tuple[np.ndarray, Optional[pd.Series]]:
         """
         Preprocess data for training/prediction.
         
+        Features are returned as a float32 ndarray in ``feature_names``
+        order; scaling is skipped for tree models.
+        
         Args:
             df: Input DataFrame
             fit_scaler: Whether to fit scaler (True for training, False for prediction)
@@ -122,25 +148,36 @@ class QualityOfLifePredictor:
         # Store feature names
         if fit_scaler:
             self.feature_names = list(X.columns)
+        elif self.feature_names is not None:
+            X = X[self.feature_names]
+        
+        X = X.to_numpy(dtype=np.float32, copy=False)
+        
+        if not self._needs_scaling:
+            if fit_scaler:
+                self.scaler = None
+            return X, y
         
         # Scale features
         if fit_scaler:
-            self.scaler = StandardScaler()
-            X_scaled = pd.DataFrame(
-                self.scaler.fit_transform(X),
-                columns=X.columns,
-                index=X.index
-            )
-        else:
-            if self.scaler is None:
-                raise ValueError("Scaler not fitted. Train model first.")
-            X_scaled = pd.DataFrame(
-                self.scaler.transform(X),
-                columns=X.columns,
-                index=X.index
-            )
+            self.scaler = StandardScaler().fit(X)
+            self._cache_scaler_params()
+        elif self.scaler is None:
+            raise ValueError("Scaler not fitted. Train model first.")
         
-        return X_scaled, y
+        return self._scale(X), y
+    
+    def _cache_scaler_params(self) -> None:
+        """Cache float32 mean and inverse scale from the fitted scaler."""
+        if self.scaler is None:
+            self._mean = self._inv_scale = None
+            return
+        self._mean = self.scaler.mean_.astype(np.float32)
+        self._inv_scale = (1.0 / self.scaler.scale_).astype(np.float32)
+    
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        """Standardize features without sklearn's per-call validation."""
+        return (X - self._mean) * self._inv_scale
     
     def train(
         self,
@@ -154,6 +191,7 @@ class QualityOfLifePredictor:
         Args:
             df: Training DataFrame
             model_type: 'random_forest' or 'gradient_boosting'
+                (HistGradientBoostingRegressor)
             test_size: Test set proportion
             
         Returns:
@@ -161,6 +199,8 @@ class QualityOfLifePredictor:
         """
         logger.info(f"Training {model_type} model...")
         
+        self._needs_scaling = model_type not in TREE_MODEL_TYPES
+        
         # Preprocess
         X, y = self.preprocess_data(df, fit_scaler=True)
         
@@ -172,16 +212,17 @@ class QualityOfLifePredictor:
         # Initialize model
         if model_type == 'random_forest':
             self.model = RandomForestRegressor(
-                n_estimators=100,
+                n_estimators=50,
                 max_depth=10,
+                max_features='sqrt',
                 min_samples_split=5,
                 min_samples_leaf=2,
                 random_state=42,
                 n_jobs=-1
             )
         elif model_type == 'gradient_boosting':
-            self.model = GradientBoostingRegressor(
-                n_estimators=100,
+            self.model = HistGradientBoostingRegressor(
+                max_iter=100,
                 max_depth=5,
                 learning_rate=0.1,
                 random_state=42
@@ -191,6 +232,7 @@ class QualityOfLifePredictor:
         
         # Train
         self.model.fit(X_train, y_train)
+        self._onnx_session = None
         
         # Evaluate
         y_pred_train = self.model.predict(X_train)
@@ -224,18 +266,44 @@ class QualityOfLifePredictor:
             'metrics': metrics
         }
         
+        # HistGradientBoosting has no impurity importances; fall back to
+        # permutation importance on the held-out split
+        if not hasattr(self.model, 'feature_importances_'):
+            result = permutation_importance(
+                self.model, X_test, y_test, n_repeats=5, random_state=42
+            )
+            self.model_metadata['feature_importances'] = result.importances_mean.tolist()
+        
         logger.info(f"Model trained successfully")
         logger.info(f"Test R²: {metrics['test_r2']:.4f}")
         logger.info(f"Test RMSE: {metrics['test_rmse']:.4f}")
         
         return metrics
     
-    def predict(self, X: pd.DataFrame) -> np.ndarray:
+    def predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
         """
         Make predictions on new data.
         
         Args:
-            X: Input features
+            X: Input features, as a DataFrame or an ndarray with columns
+                in ``feature_names`` order
+            
+        Returns:
+            Predicted quality scores
+        """
+        if not isinstance(X, np.ndarray):
+            if self.feature_names is None:
+                raise ValueError("Model not trained. Train model first.")
+            X = X[self.feature_names].to_numpy(dtype=np.float32)
+        
+        return self.predict_array(X)
+    
+    def predict_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Make predictions on a 2-D feature array without going through pandas.
+        
+        Args:
+            X: Array of shape (n_samples, n_features) in ``feature_names`` order
             
         Returns:
             Predicted quality scores
@@ -243,8 +311,15 @@ class QualityOfLifePredictor:
         if self.model is None:
             raise ValueError("Model not trained. Train model first.")
         
-        X_scaled, _ = self.preprocess_data(X, fit_scaler=False)
-        predictions = self.model.predict(X_scaled)
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        
+        if self._onnx_session is not None:
+            # The exported graph includes the scaler, so feed raw features
+            return self._onnx_session.run(None, {'input': X})[0].ravel()
+        
+        if self._needs_scaling:
+            X = self._scale(X)
+        predictions = self.model.predict(X)
         
         return predictions
     
@@ -259,14 +334,18 @@ class QualityOfLifePredictor:
             raise ValueError("Model not trained")
         
         if hasattr(self.model, 'feature_importances_'):
-            importance_df = pd.DataFrame({
-                'feature': self.feature_names,
-                'importance': self.model.feature_importances_
-            }).sort_values('importance', ascending=False)
-            
-            return importance_df
+            importances = self.model.feature_importances_
+        elif 'feature_importances' in self.model_metadata:
+            importances = self.model_metadata['feature_importances']
         else:
             return pd.DataFrame()
+        
+        importance_df = pd.DataFrame({
+            'feature': self.feature_names,
+            'importance': importances
+        }).sort_values('importance', ascending=False)
+        
+        return importance_df
     
     def save_model(self, filename: str = None) -> Path:
         """
@@ -298,8 +377,42 @@ class QualityOfLifePredictor:
         joblib.dump(save_dict, model_path)
         logger.info(f"Model saved to {model_path}")
         
+        onnx_path = model_path.with_suffix('.onnx')
+        onnx_bytes = None
+        if ort is not None:
+            try:
+                onnx_bytes = self._export_onnx()
+            except Exception as e:
+                logger.warning(f"ONNX export failed ({type(e).__name__}), serving with sklearn")
+        
+        if onnx_bytes is None:
+            # Don't leave an older export behind for load_model to prefer
+            onnx_path.unlink(missing_ok=True)
+            self._onnx_session = None
+        else:
+            onnx_path.write_bytes(onnx_bytes)
+            self._onnx_session = self._create_onnx_session(onnx_bytes)
+            logger.info(f"ONNX model saved to {onnx_path}")
+        
         return model_path
     
+    def _export_onnx(self) -> bytes:
+        """Convert the fitted scaler/model to a serialized ONNX graph."""
+        estimator = self.model
+        if self.scaler is not None:
+            estimator = make_pipeline(self.scaler, self.model)
+        
+        onnx_model = convert_sklearn(
+            estimator,
+            initial_types=[('input', FloatTensorType([None, len(self.feature_names)]))]
+        )
+        return onnx_model.SerializeToString()
+    
+    @staticmethod
+    def _create_onnx_session(onnx_model) -> "ort.InferenceSession":
+        """Create a CPU inference session from an ONNX path or serialized model."""
+        return ort.InferenceSession(onnx_model, providers=['CPUExecutionProvider'])
+    
     def load_model(self, model_path: str) -> None:
         """
         Load trained model from disk.
@@ -313,6 +426,14 @@ class QualityOfLifePredictor:
         self.scaler = model_dict['scaler']
         self.feature_names = model_dict['feature_names']
         self.model_metadata = model_dict.get('metadata', {})
+        self._needs_scaling = self.scaler is not None
+        self._cache_scaler_params()
+        
+        onnx_path = Path(model_path).with_suffix('.onnx')
+        if ort is not None and onnx_path.exists():
+            self._onnx_session = self._create_onnx_session(str(onnx_path))
+        else:
+            self._onnx_session = None
         
         logger.info(f"Model loaded from {model_path}")
         logger.info(f"Model type: {self.model_metadata.get('model_type', 'unknown')}")
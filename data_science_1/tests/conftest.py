@@ -0,0 +1,13 @@
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    # Imported lazily so a broken app module only fails the tests that use it
+    from src.app import app
+    with TestClient(app) as c:
+        yield c
@@ -1,31 +1,17 @@
 """
-Industry-standard integration test suite for Flask dashboard app.
+Industry-standard integration test suite for the Quality of Life API.
 Covers app startup, endpoint responses, and error handling for src/app.py.
 """
-from multiprocessing import Process
-import time
-import requests
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
-from src.app import app
 
-def run_app():
-    app.run(host="127.0.0.1", port=8081)
-
-def test_app_integration():
-    proc = Process(target=run_app)
-    proc.start()
-    time.sleep(2)
-    try:
-        r = requests.get("http://127.0.0.1:8081/health")
-        assert r.status_code == 200
-        assert r.json()["status"] == "ok"
-        r = requests.get("http://127.0.0.1:8081/")
-        assert r.status_code == 200
-        assert "Portfolio Showcase" in r.text
-        r = requests.get("http://127.0.0.1:8081/notfound")
-        assert r.status_code == 404
-    finally:
-        proc.terminate()
-        proc.join()
+def test_app_integration(client):
+    r = client.get("/health")
+    assert r.status_code == 200
+    assert r.json()["status"] in ("healthy", "degraded")
+    r = client.get("/")
+    assert r.status_code == 200
+    assert r.json()["message"] == "Quality of Life Prediction API"
+    r = client.get("/notfound")
+    assert r.status_code == 404
@@ -1,13 +1,11 @@
 """
-Integration test for dashboard root endpoint.
+Integration test for API root endpoint.
 """
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
-from src.app import app
 
-def test_index_endpoint():
-    client = app.test_client()
+def test_index_endpoint(client):
     response = client.get("/")
     assert response.status_code == 200
-    assert b"Portfolio Showcase" in response.data
+    assert response.json()["message"] == "Quality of Life Prediction API"
@@ -1,25 +1,21 @@
 """
-Industry-standard unit test suite for Flask dashboard app.
+Industry-standard unit test suite for the Quality of Life API.
 Covers all endpoints and error handling for src/app.py.
 """
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
-from src.app import app
 
-def test_health_endpoint():
-    client = app.test_client()
+def test_health_endpoint(client):
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json["status"] == "ok"
+    assert response.json()["status"] in ("healthy", "degraded")
 
-def test_index_endpoint():
-    client = app.test_client()
+def test_index_endpoint(client):
     response = client.get("/")
     assert response.status_code == 200
-    assert b"Portfolio Showcase" in response.data
+    assert response.json()["message"] == "Quality of Life Prediction API"
 
-def test_404():
-    client = app.test_client()
+def test_404(client):
     response = client.get("/notfound")
     assert response.status_code == 404
@@ -0,0 +1,39 @@
+"""
+Unit tests for the quality of life ML pipeline.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+from src.ml_pipeline import FEATURE_NAMES, QualityOfLifePredictor
+
+def test_failed_onnx_export_removes_stale_export(tmp_path, monkeypatch):
+    predictor = QualityOfLifePredictor(model_dir=str(tmp_path))
+    predictor.train(predictor.generate_synthetic_data(200), model_type='gradient_boosting')
+    (tmp_path / "model.onnx").write_bytes(b"stale")
+
+    def fail():
+        raise ValueError("unsupported estimator")
+    monkeypatch.setattr(predictor, "_export_onnx", fail)
+    path = predictor.save_model("model.joblib")
+
+    assert not path.with_suffix('.onnx').exists()
+    assert predictor._onnx_session is None
+    loaded = QualityOfLifePredictor(model_dir=str(tmp_path))
+    loaded.load_model(str(path))
+    assert loaded._onnx_session is None
+
+def test_cached_scaler_matches_standard_scaler(tmp_path):
+    predictor = QualityOfLifePredictor(model_dir=str(tmp_path))
+    df = predictor.generate_synthetic_data(200)
+    X = df[FEATURE_NAMES].to_numpy(dtype=np.float32)
+    predictor.scaler = StandardScaler().fit(X)
+
+    predictor._cache_scaler_params()
+    assert predictor._mean.dtype == np.float32
+    assert np.allclose(predictor._scale(X), predictor.scaler.transform(X), atol=1e-5)
+
+    predictor.scaler = None
+    predictor._cache_scaler_params()
+    assert predictor._mean is None and predictor._inv_scale is None
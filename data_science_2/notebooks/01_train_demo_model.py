@@ -27,5 +27,13 @@ import os
 model_path = os.path.join(os.path.dirname(__file__), "model.joblib")
 joblib.dump(model, model_path)
 
+# Export the linear parameters so the API can serve without unpickling sklearn
+np.savez(
+    model_path.replace(".joblib", ".npz"),
+    coef=model.coef_,
+    intercept=model.intercept_,
+    features=np.array(X_train.columns, dtype=str),
+)
+
 # Save test sample for API demo
 X_test.iloc[:5].to_json("sample_input.json", orient="records")
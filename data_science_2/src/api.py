@@ -1,19 +1,104 @@
 from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+import asyncio
 import joblib
-import pandas as pd
+import numpy as np
+import orjson
 import os
+import threading
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, serializing NumPy arrays natively."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
 
 router = APIRouter()
 
 MODEL_PATH = os.path.join(os.path.dirname(__file__), "..", "notebooks", "model.joblib")
+# Linear parameters exported next to the pickle; preferred when present
+MODEL_NPZ_PATH = os.path.splitext(MODEL_PATH)[0] + ".npz"
+FEATURES = [f"feature_{i}" for i in range(5)]
+
+_MODEL_LOCK = threading.Lock()
+# (path, mtime, model, coef, intercept, features) of the loaded model, swapped
+# as a whole so readers never mix parameters from two different files
+_MODEL_STATE = (None, None, None, None, 0.0, FEATURES)
+
+
+def model_file():
+    """
+    Path of the model file to serve, or None if nothing has been trained.
+
+    When both the pickle and the .npz export exist the newer one wins, so
+    retraining with only one of them still gets picked up.
+    """
+    existing = [path for path in (MODEL_NPZ_PATH, MODEL_PATH) if os.path.exists(path)]
+    if not existing:
+        return None
+    return max(existing, key=lambda path: os.stat(path).st_mtime_ns)
+
+
+def _load(path):
+    """Load a model file, returning (model, coef, intercept, features)."""
+    if path.endswith(".npz"):
+        with np.load(path) as params:
+            return (
+                None,
+                params["coef"].astype(np.float64).ravel(),
+                float(params["intercept"]),
+                params["features"].tolist(),
+            )
+
+    model = joblib.load(path)
+    features = list(getattr(model, "feature_names_in_", FEATURES))
+    if hasattr(model, "coef_"):
+        coef = np.asarray(model.coef_, dtype=np.float64).ravel()
+        return model, coef, float(np.ravel(model.intercept_)[0]), features
+    return model, None, 0.0, features
+
+
+def get_model():
+    """
+    Get the trained model, reloading it only when the file on disk changes.
+
+    Returns a (model, coef, intercept, features) snapshot. model is the
+    sklearn estimator, or None when serving linear parameters straight
+    from the .npz export; coef is None for non-linear models.
+    """
+    global _MODEL_STATE
+    path = model_file()
+    mtime = os.stat(path).st_mtime_ns
+    state = _MODEL_STATE
+    if path != state[0] or mtime != state[1]:
+        with _MODEL_LOCK:
+            state = _MODEL_STATE
+            if path != state[0] or mtime != state[1]:
+                state = _MODEL_STATE = (path, mtime) + _load(path)
+    return state[2:]
+
+
+def _predict_sync(data):
+    """Run model inference on a list of records (blocking)."""
+    model, coef, intercept, features = get_model()
+    # Expecting a list of dicts (records); build the matrix directly in feature order
+    X = np.fromiter(
+        (row[k] for row in data for k in features),
+        dtype=np.float64,
+        count=len(data) * len(features),
+    ).reshape(len(data), len(features))
+    if coef is not None:
+        return X.dot(coef) + intercept
+    return model.predict(X)
+
 
 @router.post("/predict")
 async def predict(request: Request):
-    data = await request.json()
-    # Expecting a list of dicts (records)
-    df = pd.DataFrame(data)
-    if not os.path.exists(MODEL_PATH):
+    data = orjson.loads(await request.body())
+    if model_file() is None:
         return {"error": "Model not found. Train it first."}
-    model = joblib.load(MODEL_PATH)
-    preds = model.predict(df)
-    return {"predictions": preds.tolist()}
+    # Keep model loading and inference off the event loop
+    preds = await asyncio.to_thread(_predict_sync, data)
+    return ORJSONResponse({"predictions": preds})
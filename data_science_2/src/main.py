@@ -1,12 +1,19 @@
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from src.api import router as api_router
+from src.api import router as api_router, get_model, model_file, ORJSONResponse
 import os
 
-app = FastAPI(title="Urban Quality of Life Analytics")
+app = FastAPI(title="Urban Quality of Life Analytics", default_response_class=ORJSONResponse)
 
 app.include_router(api_router)
 
+
+@app.on_event("startup")
+def preload_model():
+    # Load the model up front so the first request doesn't pay for it
+    if model_file() is not None:
+        get_model()
+
 dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
 if os.path.isdir(dashboard_dir):
     app.mount("/dashboard", StaticFiles(directory=dashboard_dir, html=True), name="dashboard")
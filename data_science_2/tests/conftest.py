@@ -0,0 +1,10 @@
+import pytest
+from fastapi.testclient import TestClient
+from src.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    # One client for the whole session; entering it runs the startup hooks once
+    with TestClient(app) as c:
+        yield c
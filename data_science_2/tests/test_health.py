@@ -2,11 +2,8 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-from fastapi.testclient import TestClient
-from src.main import app
 
-def test_health():
-    client = TestClient(app)
+def test_health(client):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
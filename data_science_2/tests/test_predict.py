@@ -1,10 +1,7 @@
-from fastapi.testclient import TestClient
-from src.main import app
 import json
 import os
 
-def test_predict():
-    client = TestClient(app)
+def test_predict(client):
     sample_path = os.path.join(os.path.dirname(__file__), '../notebooks/sample_input.json')
     with open(sample_path, 'r') as f:
         sample = json.load(f)
@@ -14,3 +11,17 @@ def test_predict():
     assert "predictions" in result
     assert isinstance(result["predictions"], list)
     assert len(result["predictions"]) == len(sample)
+
+
+def test_model_file_prefers_newest(tmp_path, monkeypatch):
+    from src import api
+    npz, pkl = tmp_path / "model.npz", tmp_path / "model.joblib"
+    npz.write_bytes(b"")
+    pkl.write_bytes(b"")
+    monkeypatch.setattr(api, "MODEL_NPZ_PATH", str(npz))
+    monkeypatch.setattr(api, "MODEL_PATH", str(pkl))
+    os.utime(npz, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(pkl, ns=(2_000_000_000, 2_000_000_000))
+    assert api.model_file() == str(pkl)
+    os.utime(npz, ns=(3_000_000_000, 3_000_000_000))
+    assert api.model_file() == str(npz)
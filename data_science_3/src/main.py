@@ -5,6 +5,7 @@ FastAPI server for sentiment and emotion analysis.
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
 import logging
@@ -17,7 +18,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="NLP Sentiment Analysis API",
     description="Real-time sentiment and emotion analysis using transformers",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Initialize pipeline (lazy loading)
@@ -102,9 +104,7 @@ def analyze_batch(input_data: BatchTextInput):
     
     try:
         pipeline = get_pipeline()
-        results = []
-        for text in input_data.texts:
-            results.append(pipeline.analyze(text))
+        results = pipeline.analyze_many(input_data.texts)
         
         return {
             "count": len(results),
@@ -138,5 +138,20 @@ def emotions_only(input_data: TextInput):
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8083)
+    from src.nlp_pipeline import prepare_quantized_models
+    
+    # Quantize once here rather than in each worker on first request
+    prepare_quantized_models()
+    # Every worker loads its own copy of the models, so memory grows with
+    # WEB_CONCURRENCY; it defaults to a single worker
+    uvicorn.run(
+        "src.main:app",
+        host="0.0.0.0",
+        port=8083,
+        loop="auto",  # uvloop where installed (not on Windows)
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        access_log=False
+    )
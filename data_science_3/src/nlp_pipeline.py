@@ -4,15 +4,180 @@ NLP Sentiment Analysis Pipeline
 Lightweight implementation using pre-trained transformers for sentiment analysis.
 """
 
-from transformers import pipeline
+from transformers import AutoTokenizer, pipeline
+from filelock import FileLock
 import torch
+import hashlib
 import logging
-from typing import Dict, List, Any
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    # optimum is an optional accelerator; fall back to the FP32 torch models
+    ORTModelForSequenceClassification = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Texts per forward pass when analyzing a batch
+BATCH_SIZE = 16
+
+# Result cache: entries kept, and longest text worth caching
+CACHE_SIZE = 4096
+CACHE_MAX_TEXT_LENGTH = 2000
+
+# Token budget per input; truncation happens in the tokenizer
+MAX_LENGTH = 512
+
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+EMOTION_MODEL = "j-hartmann/emotion-english-distilroberta-base"
+
+# Where dynamically quantized INT8 ONNX exports are cached
+QUANTIZED_MODEL_DIR = Path(
+    os.getenv(
+        "QUANTIZED_MODEL_DIR",
+        Path(__file__).resolve().parents[1] / "models" / "quantized"
+    )
+)
+
+
+def _use_quantized() -> bool:
+    """Whether models are served as INT8 ONNX Runtime exports."""
+    return ORTModelForSequenceClassification is not None and not torch.cuda.is_available()
+
+
+def quantize_model(model_name: str) -> Path:
+    """
+    Export a model to INT8 ONNX (with its tokenizer) unless already cached.
+    
+    The export is written to a temporary directory and renamed into place
+    under a file lock, so concurrent processes never see a partial export.
+    
+    Returns:
+        Directory holding model_quantized.onnx and the tokenizer files
+    """
+    save_dir = QUANTIZED_MODEL_DIR / model_name.replace("/", "--")
+    if (save_dir / "model_quantized.onnx").exists():
+        return save_dir
+    
+    QUANTIZED_MODEL_DIR.mkdir(parents=True, exist_ok=True)
+    with FileLock(str(save_dir) + ".lock"):
+        if (save_dir / "model_quantized.onnx").exists():
+            return save_dir
+        
+        logger.info(f"Quantizing {model_name} to INT8...")
+        tmp_dir = tempfile.mkdtemp(dir=QUANTIZED_MODEL_DIR, prefix=f".{save_dir.name}-")
+        try:
+            onnx_model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+            quantizer = ORTQuantizer.from_pretrained(onnx_model)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=tmp_dir, quantization_config=qconfig)
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(tmp_dir)
+            # Clear any partial export left behind by an older version
+            shutil.rmtree(save_dir, ignore_errors=True)
+            os.replace(tmp_dir, save_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+    return save_dir
+
+
+def prepare_quantized_models() -> None:
+    """
+    Build the INT8 exports of every served model ahead of time.
+    
+    Run once at build or before starting server workers, so no request
+    (or worker) pays for quantization.
+    """
+    if not _use_quantized():
+        logger.info("INT8 ONNX Runtime models not in use, nothing to quantize")
+        return
+    for model_name in (SENTIMENT_MODEL, EMOTION_MODEL):
+        quantize_model(model_name)
+
+
+def _quantized_model(model_name: str):
+    """Load an INT8 ONNX Runtime export of a model, quantizing it if needed."""
+    save_dir = quantize_model(model_name)
+    model = ORTModelForSequenceClassification.from_pretrained(
+        save_dir, file_name="model_quantized.onnx"
+    )
+    return model, AutoTokenizer.from_pretrained(save_dir)
+
+
+def _build_pipeline(task: str, model_name: str, **kwargs):
+    """
+    Build a HF pipeline, preferring an INT8 ONNX Runtime model on CPU.
+    
+    Falls back to the FP32 torch model when optimum is not installed,
+    a GPU is available, or quantization fails.
+    """
+    kwargs.update(truncation=True, max_length=MAX_LENGTH)
+    if _use_quantized():
+        try:
+            model, tokenizer = _quantized_model(model_name)
+            return pipeline(task, model=model, tokenizer=tokenizer, **kwargs)
+        except Exception as e:
+            logger.warning(f"INT8 model unavailable ({type(e).__name__}), using FP32")
+    
+    nlp = pipeline(
+        task,
+        model=model_name,
+        device=0 if torch.cuda.is_available() else -1,
+        **kwargs
+    )
+    nlp.model.eval()
+    return nlp
+
+
+class _ResultCache:
+    """
+    Thread-safe LRU cache of model outputs keyed by a hash of the text.
+    
+    Only the model output is cached (not the response dict), so callers
+    still stamp each response with a fresh timestamp.
+    """
+    
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(text: str) -> Optional[bytes]:
+        if len(text) > CACHE_MAX_TEXT_LENGTH:
+            return None
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    
+    def get(self, text: str):
+        key = self._key(text)
+        if key is None:
+            return None
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, text: str, value) -> None:
+        key = self._key(text)
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
 
 class SentimentAnalyzer:
     """Sentiment analysis using pre-trained DistilBERT."""
@@ -20,35 +185,77 @@ class SentimentAnalyzer:
     def __init__(self):
         """Initialize sentiment analyzer."""
         logger.info("Loading sentiment model...")
-        self.sentiment_pipeline = pipeline(
+        self.sentiment_pipeline = _build_pipeline(
             "sentiment-analysis",
-            model="distilbert-base-uncased-finetuned-sst-2-english",
-            device=0 if torch.cuda.is_available() else -1
+            SENTIMENT_MODEL
         )
+        self._cache = _ResultCache()
         logger.info("Model loaded")
     
+    @staticmethod
+    def _format(text: str, label: str, score: float, timestamp: str) -> Dict[str, Any]:
+        return {
+            "text": text[:100] + "..." if len(text) > 100 else text,
+            "label": label,
+            "score": score,
+            "timestamp": timestamp
+        }
+    
     def analyze(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment of text."""
         if not text or len(text.strip()) == 0:
             return {"label": "NEUTRAL", "score": 0.0, "error": "Empty text"}
         
         try:
-            result = self.sentiment_pipeline(text[:512])[0]
-            return {
-                "text": text[:100] + "..." if len(text) > 100 else text,
-                "label": result["label"],
-                "score": round(result["score"], 4),
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            cached = self._cache.get(text)
+            if cached is None:
+                with torch.inference_mode():
+                    result = self.sentiment_pipeline(text)[0]
+                cached = (result["label"], round(result["score"], 4))
+                self._cache.put(text, cached)
+            return self._format(text, *cached, datetime.utcnow().isoformat())
         except Exception as e:
             logger.error(f"Error: {e}")
             return {"label": "ERROR", "score": 0.0, "error": str(e)}
     
     def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
         """Analyze multiple texts."""
-        results = []
-        for text in texts:
-            results.append(self.analyze(text))
+        return self.analyze_many(texts)
+    
+    def analyze_many(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze sentiment of multiple texts in batched forward passes."""
+        results = [
+            {"label": "NEUTRAL", "score": 0.0, "error": "Empty text"}
+            for _ in texts
+        ]
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return results
+        
+        cached = {i: self._cache.get(texts[i]) for i in indices}
+        misses = [i for i in indices if cached[i] is None]
+        if misses:
+            try:
+                unique = list(dict.fromkeys(texts[i] for i in misses))
+                with torch.inference_mode():
+                    outputs = self.sentiment_pipeline(unique, batch_size=BATCH_SIZE)
+            except Exception as e:
+                logger.error(f"Error: {e}")
+                for i in indices:
+                    results[i] = {"label": "ERROR", "score": 0.0, "error": str(e)}
+                return results
+            
+            computed = {
+                text: (result["label"], round(result["score"], 4))
+                for text, result in zip(unique, outputs)
+            }
+            for i in misses:
+                cached[i] = computed[texts[i]]
+                self._cache.put(texts[i], cached[i])
+        
+        timestamp = datetime.utcnow().isoformat()
+        for i in indices:
+            results[i] = self._format(texts[i], *cached[i], timestamp)
         return results
 
 
@@ -59,16 +266,31 @@ class EmotionAnalyzer:
         """Initialize emotion analyzer."""
         logger.info("Loading emotion model...")
         try:
-            self.emotion_pipeline = pipeline(
+            self.emotion_pipeline = _build_pipeline(
                 "text-classification",
-                model="j-hartmann/emotion-english-distilroberta-base",
-                top_k=3,
-                device=0 if torch.cuda.is_available() else -1
+                EMOTION_MODEL,
+                top_k=3
             )
             logger.info("Emotion model loaded")
         except Exception as e:
             logger.warning(f"Emotion model unavailable: {e}")
             self.emotion_pipeline = None
+        self._cache = _ResultCache()
+    
+    @staticmethod
+    def _scores(results: List[Dict[str, Any]]) -> Tuple[Tuple[str, float], ...]:
+        return tuple((e["label"], round(e["score"], 4)) for e in results)
+    
+    @staticmethod
+    def _format(text: str, scores, timestamp: str) -> Dict[str, Any]:
+        return {
+            "text": text[:100] + "..." if len(text) > 100 else text,
+            "emotions": [
+                {"emotion": label, "score": score}
+                for label, score in scores
+            ],
+            "timestamp": timestamp
+        }
     
     def analyze(self, text: str) -> Dict[str, Any]:
         """Detect emotions in text."""
@@ -76,17 +298,44 @@ class EmotionAnalyzer:
             return {"error": "Model not available"}
         
         try:
-            results = self.emotion_pipeline(text[:512])[0]
-            return {
-                "text": text[:100] + "..." if len(text) > 100 else text,
-                "emotions": [
-                    {"emotion": e["label"], "score": round(e["score"], 4)}
-                    for e in results
-                ],
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            scores = self._cache.get(text)
+            if scores is None:
+                with torch.inference_mode():
+                    results = self.emotion_pipeline(text)[0]
+                scores = self._scores(results)
+                self._cache.put(text, scores)
+            return self._format(text, scores, datetime.utcnow().isoformat())
         except Exception as e:
             return {"error": str(e)}
+    
+    def analyze_many(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Detect emotions in multiple texts in batched forward passes."""
+        if not self.emotion_pipeline:
+            return [{"error": "Model not available"} for _ in texts]
+        
+        scores = [self._cache.get(text) for text in texts]
+        misses = [i for i, s in enumerate(scores) if s is None]
+        if misses:
+            try:
+                unique = list(dict.fromkeys(texts[i] for i in misses))
+                with torch.inference_mode():
+                    outputs = self.emotion_pipeline(unique, batch_size=BATCH_SIZE)
+            except Exception as e:
+                return [{"error": str(e)} for _ in texts]
+            
+            computed = {
+                text: self._scores(results)
+                for text, results in zip(unique, outputs)
+            }
+            for i in misses:
+                scores[i] = computed[texts[i]]
+                self._cache.put(texts[i], scores[i])
+        
+        timestamp = datetime.utcnow().isoformat()
+        return [
+            self._format(text, text_scores, timestamp)
+            for text, text_scores in zip(texts, scores)
+        ]
 
 
 class NLPPipeline:
@@ -114,3 +363,21 @@ class NLPPipeline:
             result["emotions"] = emotions["emotions"]
         
         return result
+    
+    def analyze_many(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run complete analysis on multiple texts, batching model calls."""
+        sentiments = self.sentiment_analyzer.analyze_many(texts)
+        emotions = self.emotion_analyzer.analyze_many(texts)
+        
+        results = []
+        for text, sentiment, emotion in zip(texts, sentiments, emotions):
+            result = {"text": text[:100] + "..." if len(text) > 100 else text}
+            result["sentiment"] = {
+                "label": sentiment["label"],
+                "score": sentiment["score"]
+            }
+            if "emotions" in emotion:
+                result["emotions"] = emotion["emotions"]
+            results.append(result)
+        
+        return results
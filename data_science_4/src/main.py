@@ -5,10 +5,13 @@ FastAPI service for model lifecycle management.
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+from functools import lru_cache
 import numpy as np
 import logging
+import time
 
 from src.mlops_platform import MLOpsExperiment, ModelMonitor
 
@@ -18,7 +21,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="MLOps Platform API",
     description="Model lifecycle management with experiment tracking",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Global state
@@ -26,6 +30,48 @@ experiment = MLOpsExperiment("api-models")
 monitor = ModelMonitor()
 current_model = None
 
+# Tracking-store reads are cached for this long; /train invalidates early
+RUNS_CACHE_TTL_SECONDS = 5
+_runs_version = 0
+
+
+def _runs_cache_key():
+    """Cache key that changes every TTL window and after each training run."""
+    return int(time.time() // RUNS_CACHE_TTL_SECONDS), _runs_version
+
+
+@lru_cache(maxsize=1)
+def _cached_compare(ts_bucket: int, version: int):
+    return experiment.compare_models()
+
+
+@lru_cache(maxsize=1)
+def _cached_best_run(ts_bucket: int, version: int):
+    _, best_run = experiment.get_best_model()
+    return best_run
+
+
+def warm_up(model, n_warmup: int = 2):
+    """Run dummy predictions so the first real request hits warm caches."""
+    dummy = np.zeros((1, model.n_features_in_), dtype=np.float32)
+    for _ in range(n_warmup):
+        model.predict(dummy)
+
+
+@app.on_event("startup")
+def load_best_model():
+    """Load and warm the best tracked model, if one exists."""
+    global current_model
+    try:
+        model, best_run = experiment.get_best_model()
+    except Exception as e:
+        logger.info(f"No model loaded at startup: {e}")
+        return
+    
+    warm_up(model)
+    current_model = model
+    logger.info(f"Serving best model from run {best_run['run_id']}")
+
 
 class TrainRequest(BaseModel):
     """Model training request."""
@@ -61,7 +107,7 @@ def health():
     return {
         "status": "healthy",
         "model_loaded": current_model is not None,
-        "predictions_logged": len(monitor.predictions_log)
+        "predictions_logged": len(monitor)
     }
 
 
@@ -72,7 +118,7 @@ def train_model(request: TrainRequest):
     
     Trains model with MLflow tracking and returns metrics.
     """
-    global current_model
+    global current_model, _runs_version
     
     if request.model_type not in ["random_forest", "gradient_boosting"]:
         raise HTTPException(
@@ -89,8 +135,10 @@ def train_model(request: TrainRequest):
             n_features=request.n_features
         )
         
-        # Update current model
+        # Warm up before swapping in, so the first /predict is not a cold call
+        warm_up(model)
         current_model = model
+        _runs_version += 1
         
         return {
             "status": "success",
@@ -121,17 +169,17 @@ def predict(request: PredictRequest):
         )
     
     try:
-        features_array = np.array(request.features)
+        features_array = np.asarray(request.features, dtype=np.float32)
         predictions = current_model.predict(features_array)
         
         # Log predictions for monitoring
-        for features, pred in zip(features_array, predictions):
-            monitor.log_prediction(features, pred)
+        monitor.log_predictions(features_array, predictions)
         
-        return {
-            "predictions": predictions.tolist(),
+        # Returned directly so orjson serializes the array without .tolist()
+        return ORJSONResponse({
+            "predictions": predictions,
             "count": len(predictions)
-        }
+        })
     
     except Exception as e:
         logger.error(f"Prediction error: {e}")
@@ -146,7 +194,7 @@ def list_models():
     Returns comparison of all models in the experiment.
     """
     try:
-        comparison = experiment.compare_models()
+        comparison = _cached_compare(*_runs_cache_key())
         
         if comparison.empty:
             return {"models": [], "count": 0}
@@ -171,7 +219,7 @@ def get_best_model():
     Returns best model based on test accuracy.
     """
     try:
-        _, best_run = experiment.get_best_model()
+        best_run = _cached_best_run(*_runs_cache_key())
         
         return {
             "run_id": best_run["run_id"],
@@ -201,4 +249,12 @@ def get_metrics():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8084)
+    # Single worker: the served model and prediction log live in process memory
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8084,
+        loop="auto",  # uvloop where installed (not on Windows)
+        http="httptools",
+        access_log=False
+    )
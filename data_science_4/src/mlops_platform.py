@@ -6,22 +6,51 @@ Demonstrates model training, versioning, monitoring, and automated retraining.
 
 import mlflow
 import mlflow.sklearn
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 from sklearn.datasets import make_classification
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from pathlib import Path
 import logging
+import threading
 from typing import Dict, Any, Tuple, Optional
 import joblib
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True, fastmath=True)
+def _batch_stats(X):
+    """Row-wise mean and (population) std of a 2-D float array."""
+    n, m = X.shape
+    means = np.empty(n)
+    stds = np.empty(n)
+    for i in range(n):
+        total = 0.0
+        for j in range(m):
+            total += X[i, j]
+        mean = total / m
+        sq = 0.0
+        for j in range(m):
+            d = X[i, j] - mean
+            sq += d * d
+        means[i] = mean
+        stds[i] = np.sqrt(sq / m)
+    return means, stds
+
+
 class MLOpsExperiment:
     """
     MLOps experiment tracking with MLflow.
@@ -60,6 +89,8 @@ class MLOpsExperiment:
                 n_redundant=5,
                 random_state=42
             )
+            # Trees split on float32 internally; casting up front halves memory
+            X = X.astype(np.float32, copy=False)
             
             X_train, X_test, y_train, y_test = train_test_split(
                 X, y, test_size=0.2, random_state=42
@@ -76,18 +107,20 @@ class MLOpsExperiment:
                 model = RandomForestClassifier(
                     n_estimators=100,
                     max_depth=10,
-                    random_state=42
+                    random_state=42,
+                    n_jobs=-1
                 )
                 mlflow.log_param("n_estimators", 100)
                 mlflow.log_param("max_depth", 10)
             else:
-                model = GradientBoostingClassifier(
-                    n_estimators=100,
+                model = HistGradientBoostingClassifier(
+                    max_iter=100,
                     max_depth=5,
                     learning_rate=0.1,
                     random_state=42
                 )
-                mlflow.log_param("n_estimators", 100)
+                mlflow.log_param("max_iter", 100)
+                mlflow.log_param("max_depth", 5)
                 mlflow.log_param("learning_rate", 0.1)
             
             # Train
@@ -106,7 +139,7 @@ class MLOpsExperiment:
             }
             
             # Cross-validation
-            cv_scores = cross_val_score(model, X_train, y_train, cv=5)
+            cv_scores = cross_val_score(model, X_train, y_train, cv=5, n_jobs=-1)
             metrics["cv_accuracy_mean"] = cv_scores.mean()
             metrics["cv_accuracy_std"] = cv_scores.std()
             
@@ -117,16 +150,16 @@ class MLOpsExperiment:
             # Log model
             mlflow.sklearn.log_model(model, "model")
             
-            # Log feature importance if available
+            # Log feature importance if available (not on histogram boosting)
             if hasattr(model, 'feature_importances_'):
                 importance_df = pd.DataFrame({
                     'feature': [f"feature_{i}" for i in range(n_features)],
                     'importance': model.feature_importances_
                 }).sort_values('importance', ascending=False)
                 
-                importance_df.to_csv("feature_importance.csv", index=False)
-                mlflow.log_artifact("feature_importance.csv")
-                Path("feature_importance.csv").unlink()
+                mlflow.log_text(
+                    importance_df.to_csv(index=False), "feature_importance.csv"
+                )
             
             logger.info(f"Model trained: {model_type}")
             logger.info(f"Test Accuracy: {metrics['test_accuracy']:.4f}")
@@ -198,11 +231,68 @@ class MLOpsExperiment:
 class ModelMonitor:
     """
     Monitor model performance over time.
+    
+    Predictions are stored column-wise in preallocated NumPy arrays that
+    grow geometrically, so logging is amortized O(1) per row and metrics
+    are computed without building a DataFrame.
     """
     
+    INITIAL_CAPACITY = 1024
+    
     def __init__(self):
         """Initialize model monitor."""
-        self.predictions_log = []
+        capacity = self.INITIAL_CAPACITY
+        self._pred = np.empty(capacity, dtype=np.int32)
+        self._fm = np.empty(capacity, dtype=np.float32)
+        self._fs = np.empty(capacity, dtype=np.float32)
+        # -1 marks predictions without a known true label
+        self._true = np.empty(capacity, dtype=np.int32)
+        self._timestamps = []
+        self._n = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return self._n
+    
+    def _reserve(self, extra: int):
+        """Grow the column arrays to fit `extra` more rows."""
+        needed = self._n + extra
+        capacity = len(self._pred)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_pred", "_fm", "_fs", "_true"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+    
+    @property
+    def predictions_log(self):
+        """Logged predictions as a list of dicts (built on demand)."""
+        with self._lock:
+            n = self._n
+            rows = zip(
+                self._timestamps[:n],
+                self._pred[:n].tolist(),
+                self._fm[:n].tolist(),
+                self._fs[:n].tolist(),
+                self._true[:n].tolist()
+            )
+            log = []
+            for timestamp, prediction, mean, std, true_label in rows:
+                entry = {
+                    "timestamp": timestamp,
+                    "prediction": prediction,
+                    "features_mean": mean,
+                    "features_std": std
+                }
+                if true_label >= 0:
+                    entry["true_label"] = true_label
+                    entry["correct"] = int(prediction == true_label)
+                log.append(entry)
+            return log
     
     def log_prediction(
         self,
@@ -218,18 +308,39 @@ class ModelMonitor:
             prediction: Model prediction
             true_label: True label (if available)
         """
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "prediction": int(prediction),
-            "features_mean": float(features.mean()),
-            "features_std": float(features.std())
-        }
+        with self._lock:
+            self._reserve(1)
+            i = self._n
+            self._pred[i] = int(prediction)
+            self._fm[i] = features.mean()
+            self._fs[i] = features.std()
+            self._true[i] = -1 if true_label is None else int(true_label)
+            self._timestamps.append(datetime.utcnow().isoformat())
+            self._n += 1
+    
+    def log_predictions(self, features: np.ndarray, predictions: np.ndarray):
+        """
+        Log a batch of predictions for monitoring.
         
-        if true_label is not None:
-            log_entry["true_label"] = int(true_label)
-            log_entry["correct"] = int(prediction == true_label)
+        Feature statistics for all rows are computed in one pass.
         
-        self.predictions_log.append(log_entry)
+        Args:
+            features: Input features, one row per prediction
+            predictions: Model predictions
+        """
+        means, stds = _batch_stats(np.ascontiguousarray(features, dtype=np.float64))
+        count = len(predictions)
+        timestamp = datetime.utcnow().isoformat()
+        
+        with self._lock:
+            self._reserve(count)
+            i, j = self._n, self._n + count
+            self._pred[i:j] = predictions
+            self._fm[i:j] = means
+            self._fs[i:j] = stds
+            self._true[i:j] = -1
+            self._timestamps.extend([timestamp] * count)
+            self._n = j
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """
@@ -238,19 +349,26 @@ class ModelMonitor:
         Returns:
             Performance metrics
         """
-        if not self.predictions_log:
-            return {"error": "No predictions logged"}
-        
-        df = pd.DataFrame(self.predictions_log)
+        with self._lock:
+            n = self._n
+            if n == 0:
+                return {"error": "No predictions logged"}
+            
+            predictions = self._pred[:n]
+            true_labels = self._true[:n]
+            counts = np.bincount(predictions)
+            labels = np.flatnonzero(counts)
+            labeled = true_labels >= 0
+            correct = predictions[labeled] == true_labels[labeled]
         
         metrics = {
-            "total_predictions": len(df),
-            "prediction_distribution": df["prediction"].value_counts().to_dict()
+            "total_predictions": n,
+            "prediction_distribution": dict(zip(labels.tolist(), counts[labels].tolist()))
         }
         
-        if "correct" in df.columns:
-            metrics["accuracy"] = df["correct"].mean()
-            metrics["total_correct"] = int(df["correct"].sum())
+        if correct.size:
+            metrics["accuracy"] = float(correct.mean())
+            metrics["total_correct"] = int(correct.sum())
         
         return metrics
 
@@ -1,6 +1,8 @@
 """Force calculation functions"""
+from dataclasses import dataclass, field
+from math import hypot
 import numpy as np
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
     from .particle import Particle
@@ -10,18 +12,28 @@ if TYPE_CHECKING:
 G_EARTH = 9.81  # m/s^2
 
 
-def gravity_force(particle: 'Particle', g: float = G_EARTH) -> np.ndarray:
+def gravity_force(
+    particle: 'Particle',
+    g: float = G_EARTH,
+    out: np.ndarray = None
+) -> np.ndarray:
     """
     Calculate gravitational force on particle
     
     Args:
         particle: Particle object
         g: Gravitational acceleration (default: Earth's gravity)
+        out: Optional 2-vector to write into instead of allocating; the
+            caller owns it and must consume the value before reusing it
         
     Returns:
-        Force vector [Fx, Fy]
+        Force vector [Fx, Fy] (out, when given)
     """
-    return np.array([0.0, -particle.mass * g])
+    if out is None:
+        return np.array([0.0, -particle.mass * g])
+    out[0] = 0.0
+    out[1] = -particle.mass * g
+    return out
 
 
 def friction_force(
@@ -38,13 +50,14 @@ def friction_force(
     Returns:
         Force vector [Fx, Fy]
     """
-    if np.linalg.norm(particle.velocity) < 1e-6:
+    vx, vy = particle.velocity
+    speed = hypot(vx, vy)
+    if speed < 1e-6:
         return np.array([0.0, 0.0])
     
     # Friction opposes motion
-    direction = particle.velocity / np.linalg.norm(particle.velocity)
-    magnitude = coefficient * particle.mass * G_EARTH
-    return -magnitude * direction
+    scale = -coefficient * particle.mass * G_EARTH / speed
+    return np.array([scale * vx, scale * vy])
 
 
 def spring_force(
@@ -65,16 +78,182 @@ def spring_force(
     Returns:
         Force vector [Fx, Fy]
     """
-    displacement = particle.position - anchor
-    distance = np.linalg.norm(displacement)
+    px, py = particle.position
+    dx = px - anchor[0]
+    dy = py - anchor[1]
+    distance = hypot(dx, dy)
     
     if distance < 1e-6:
         return np.array([0.0, 0.0])
     
-    # F = -k * (x - x0)
-    extension = distance - rest_length
-    direction = displacement / distance
-    return -k * extension * direction
+    # F = -k * (x - x0) along the unit displacement
+    scale = -k * (distance - rest_length) / distance
+    return np.array([scale * dx, scale * dy])
+
+
+@dataclass(frozen=True)
+class FrictionForce:
+    """
+    Friction on a particle of fixed mass, as friction_force
+    
+    The magnitude coefficient * mass * G_EARTH is computed once at
+    construction; calling the instance only scales the velocity direction.
+    
+    Args:
+        coefficient: Friction coefficient
+        mass: Mass of the particle the force will act on
+    """
+    coefficient: float
+    mass: float
+    _magnitude: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(
+            self, '_magnitude', self.coefficient * self.mass * G_EARTH
+        )
+        
+    def __call__(self, particle: 'Particle', out: np.ndarray = None) -> np.ndarray:
+        """
+        Force vector [Fx, Fy] on particle, written into out when given
+        """
+        out = np.empty(2) if out is None else out
+        vx, vy = particle.velocity
+        speed = hypot(vx, vy)
+        if speed < 1e-6:
+            out[0] = out[1] = 0.0
+            return out
+        
+        scale = -self._magnitude / speed
+        out[0] = scale * vx
+        out[1] = scale * vy
+        return out
+
+
+@dataclass(frozen=True)
+class SpringForce:
+    """
+    Spring force (Hooke's law) toward a fixed anchor, as spring_force
+    
+    The anchor coordinates are unpacked to floats once at construction.
+    
+    Args:
+        k: Spring constant
+        anchor: Spring anchor point [x, y]
+        rest_length: Natural length of spring
+    """
+    k: float
+    anchor: Sequence[float]
+    rest_length: float = 0.0
+    _anchor_x: float = field(init=False, repr=False, compare=False)
+    _anchor_y: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_anchor_x', float(self.anchor[0]))
+        object.__setattr__(self, '_anchor_y', float(self.anchor[1]))
+        
+    def __call__(self, particle: 'Particle', out: np.ndarray = None) -> np.ndarray:
+        """
+        Force vector [Fx, Fy] on particle, written into out when given
+        """
+        out = np.empty(2) if out is None else out
+        px, py = particle.position
+        dx = px - self._anchor_x
+        dy = py - self._anchor_y
+        distance = hypot(dx, dy)
+        if distance < 1e-6:
+            out[0] = out[1] = 0.0
+            return out
+        
+        scale = -self.k * (distance - self.rest_length) / distance
+        out[0] = scale * dx
+        out[1] = scale * dy
+        return out
+
+
+def gravity_force_batch(
+    mass: np.ndarray,
+    g: float = G_EARTH,
+    out: np.ndarray = None
+) -> np.ndarray:
+    """
+    Gravitational force on N particles at once
+    
+    Args:
+        mass: Particle masses, shape (N,)
+        g: Gravitational acceleration (default: Earth's gravity)
+        out: Optional (N, 2) buffer to write into
+        
+    Returns:
+        Force array, shape (N, 2)
+    """
+    if out is None:
+        out = np.empty((len(mass), 2))
+    out[:, 0] = 0.0
+    np.multiply(mass, -g, out=out[:, 1])
+    return out
+
+
+def friction_force_batch(
+    velocity: np.ndarray,
+    mass: np.ndarray,
+    coefficient: float = 0.1,
+    out: np.ndarray = None,
+    work: np.ndarray = None
+) -> np.ndarray:
+    """
+    Friction force (simplified drag model) on N particles at once
+    
+    Args:
+        velocity: Particle velocities, shape (N, 2)
+        mass: Particle masses, shape (N,)
+        coefficient: Friction coefficient
+        out: Optional (N, 2) buffer to write into
+        work: Optional (2, N) scratch buffer, so repeated calls allocate nothing
+        
+    Returns:
+        Force array, shape (N, 2)
+    """
+    if work is None:
+        work = np.empty((2, len(mass)))
+    speed, scale = work
+    np.sqrt(np.einsum('ij,ij->i', velocity, velocity), out=speed)
+    
+    # -coef * m * g / |v| per particle, zero where (nearly) stationary
+    scale.fill(0.0)
+    np.divide(mass, speed, out=scale, where=speed >= 1e-6)
+    scale *= -coefficient * G_EARTH
+    return np.multiply(velocity, scale[:, None], out=out)
+
+
+def spring_force_batch(
+    position: np.ndarray,
+    anchor: np.ndarray,
+    k: float = 10.0,
+    rest_length: float = 0.0,
+    out: np.ndarray = None
+) -> np.ndarray:
+    """
+    Spring force (Hooke's law) on N particles tied to one anchor
+    
+    Args:
+        position: Particle positions, shape (N, 2)
+        anchor: Spring anchor point [x, y]
+        k: Spring constant
+        rest_length: Natural length of spring
+        out: Optional (N, 2) buffer to write into
+        
+    Returns:
+        Force array, shape (N, 2)
+    """
+    # The displacement is built in the output buffer and scaled in place
+    displacement = np.subtract(position, anchor, out=out)
+    distance = np.sqrt(np.einsum('ij,ij->i', displacement, displacement))
+    
+    scale = np.zeros_like(distance)
+    np.divide(distance - rest_length, distance, out=scale, where=distance >= 1e-6)
+    scale *= -k
+    displacement *= scale[:, None]
+    return displacement
 
 
 def net_force(*forces: np.ndarray) -> np.ndarray:
@@ -87,4 +266,24 @@ def net_force(*forces: np.ndarray) -> np.ndarray:
     Returns:
         Net force vector [Fx, Fy]
     """
-    return sum(forces)
+    if len(forces) == 1:
+        return np.array(forces[0], dtype=float)
+    # One reduction over the stacked forces instead of pairwise temporaries
+    return np.add.reduce(forces, axis=0)
+
+
+def net_force_inplace(out: np.ndarray, *forces: np.ndarray) -> np.ndarray:
+    """
+    Accumulate forces into a caller-owned buffer without allocating
+    
+    Args:
+        out: Buffer receiving the net force, overwritten
+        *forces: Variable number of force vectors
+        
+    Returns:
+        out, holding the net force vector [Fx, Fy]
+    """
+    out.fill(0.0)
+    for force in forces:
+        out += force
+    return out
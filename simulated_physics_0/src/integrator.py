@@ -1,6 +1,11 @@
 """Numerical integration methods for physics simulation"""
+import math
+import threading
 import numpy as np
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Dict
+
+from .forces import G_EARTH, gravity_force
+from .particle import ScalarParticle
 
 if TYPE_CHECKING:
     from .particle import Particle
@@ -14,19 +19,56 @@ def euler_step(
     """
     Update particle state using Euler integration
     
+    The particle's acceleration attribute is left untouched; call
+    particle.apply_force(force) to inspect it.
+    
     Args:
         particle: Particle to update
         force: Net force acting on particle
         dt: Time step
     """
-    # Update acceleration from force
-    particle.apply_force(force)
+    if isinstance(particle, ScalarParticle):
+        _euler_step_scalar(particle, force, dt)
+        return
+    euler_step_inplace(particle, force, dt, np.empty_like(particle.velocity))
+
+
+def _euler_step_scalar(
+    particle: ScalarParticle,
+    force: np.ndarray,
+    dt: float
+) -> None:
+    """Euler step on a ScalarParticle's float fields"""
+    fx, fy = force
+    scale = dt / particle.mass
+    particle.vx += fx * scale
+    particle.vy += fy * scale
+    particle.x += particle.vx * dt
+    particle.y += particle.vy * dt
+
+
+def euler_step_inplace(
+    particle: 'Particle',
+    force: np.ndarray,
+    dt: float,
+    scratch: np.ndarray
+) -> None:
+    """
+    Euler step that writes into existing arrays instead of allocating
     
-    # Update velocity: v(t+dt) = v(t) + a*dt
-    particle.velocity += particle.acceleration * dt
+    Args:
+        particle: Particle to update
+        force: Net force acting on particle
+        dt: Time step
+        scratch: Caller-owned buffer shaped like the particle's velocity
+    """
+    # Update velocity: v(t+dt) = v(t) + (F/m)*dt
+    np.multiply(force, dt / particle.mass, out=scratch)
+    particle.velocity += scratch
     
     # Update position: x(t+dt) = x(t) + v*dt
-    particle.position += particle.velocity * dt
+    np.multiply(particle.velocity, dt, out=scratch)
+    particle.position += scratch
 
 
 def verlet_step(
@@ -38,71 +80,308 @@ def verlet_step(
     """
     Update particle state using Verlet integration (more accurate for oscillations)
     
+    Like euler_step, this does not write particle.acceleration.
+    
     Args:
         particle: Particle to update
         force: Net force acting on particle
         dt: Time step
         previous_position: Position at previous time step
     """
-    particle.apply_force(force)
-    
     if previous_position is None:
         # First step: fall back to Euler
         euler_step(particle, force, dt)
     else:
-        # Verlet: x(t+dt) = 2*x(t) - x(t-dt) + a*dt^2
+        # Verlet: x(t+dt) = 2*x(t) - x(t-dt) + (F/m)*dt^2
         new_position = (2 * particle.position - 
                        previous_position + 
-                       particle.acceleration * dt**2)
+                       force * (dt**2 / particle.mass))
         
-        # Update velocity from position change
-        particle.velocity = (new_position - particle.position) / dt
-        particle.position = new_position
+        # Update velocity from position change; write in place so views
+        # (e.g. ParticleSystem rows) stay in sync
+        np.subtract(new_position, particle.position, out=particle.velocity)
+        particle.velocity /= dt
+        np.copyto(particle.position, new_position)
 
 
-def rk4_step(
+class RK4Integrator:
+    """
+    4th order Runge-Kutta stepper with preallocated stage buffers
+    
+    All intermediate states live in buffers created once in __init__ and
+    updated with in-place NumPy ops, so a step allocates nothing beyond
+    what force_func itself returns.
+    """
+    
+    def __init__(self, dim: int = 2):
+        """
+        Initialize stage buffers
+        
+        Args:
+            dim: Spatial dimension of the particles being integrated
+        """
+        self._pos0 = np.empty(dim)
+        self._vel0 = np.empty(dim)
+        self._a1 = np.empty(dim)
+        self._a2 = np.empty(dim)
+        self._a3 = np.empty(dim)
+        self._a4 = np.empty(dim)
+        self._v2 = np.empty(dim)
+        self._v3 = np.empty(dim)
+        self._v4 = np.empty(dim)
+        self._tmp = np.empty(dim)
+        
+    def step(
+        self,
+        particle: 'Particle',
+        force_func: Callable,
+        dt: float
+    ) -> None:
+        """
+        Advance particle by one RK4 step, updating its arrays in place
+        
+        Args:
+            particle: Particle to update
+            force_func: Function that takes particle and returns force
+            dt: Time step
+        """
+        pos0, vel0, tmp = self._pos0, self._vel0, self._tmp
+        a1, a2, a3, a4 = self._a1, self._a2, self._a3, self._a4
+        v2, v3, v4 = self._v2, self._v3, self._v4
+        mass = particle.mass
+        half_dt = 0.5 * dt
+        
+        # Store original state
+        np.copyto(pos0, particle.position)
+        np.copyto(vel0, particle.velocity)
+        
+        # k1 (v1 = vel0)
+        np.divide(force_func(particle), mass, out=a1)
+        
+        # k2
+        np.multiply(vel0, half_dt, out=tmp)
+        np.add(pos0, tmp, out=particle.position)
+        np.multiply(a1, half_dt, out=tmp)
+        np.add(vel0, tmp, out=v2)
+        np.copyto(particle.velocity, v2)
+        np.divide(force_func(particle), mass, out=a2)
+        
+        # k3
+        np.multiply(v2, half_dt, out=tmp)
+        np.add(pos0, tmp, out=particle.position)
+        np.multiply(a2, half_dt, out=tmp)
+        np.add(vel0, tmp, out=v3)
+        np.copyto(particle.velocity, v3)
+        np.divide(force_func(particle), mass, out=a3)
+        
+        # k4
+        np.multiply(v3, dt, out=tmp)
+        np.add(pos0, tmp, out=particle.position)
+        np.multiply(a3, dt, out=tmp)
+        np.add(vel0, tmp, out=v4)
+        np.copyto(particle.velocity, v4)
+        np.divide(force_func(particle), mass, out=a4)
+        
+        # Combine: x += dt/6 * (v1 + 2*v2 + 2*v3 + v4)
+        np.add(v2, v3, out=tmp)
+        tmp *= 2.0
+        tmp += vel0
+        tmp += v4
+        tmp *= dt / 6
+        np.add(pos0, tmp, out=particle.position)
+        
+        # v += dt/6 * (a1 + 2*a2 + 2*a3 + a4)
+        np.add(a2, a3, out=tmp)
+        tmp *= 2.0
+        tmp += a1
+        tmp += a4
+        tmp *= dt / 6
+        np.add(vel0, tmp, out=particle.velocity)
+
+
+def rk4_step_gravity(particle: 'Particle', g: float, dt: float) -> None:
+    """
+    Exact step under uniform gravity alone
+    
+    The acceleration (0, -g) is constant, so the motion is quadratic and
+    this closed form equals what RK4 computes, without calling a force
+    function four times.
+    
+    Args:
+        particle: Particle to update
+        g: Gravitational acceleration
+        dt: Time step
+    """
+    position, velocity = particle.position, particle.velocity
+    position[0] += velocity[0] * dt
+    position[1] += velocity[1] * dt - 0.5 * g * dt * dt
+    velocity[1] -= g * dt
+
+
+def rk4_step_spring(
     particle: 'Particle',
-    force_func: Callable,
+    k: float,
+    anchor: np.ndarray,
     dt: float
 ) -> None:
     """
-    Update particle state using 4th order Runge-Kutta integration
+    Exact step for a zero-rest-length spring acting alone
+    
+    Each axis is a harmonic oscillator about the anchor with angular
+    frequency sqrt(k/m), so one sin/cos pair replaces the four RK4 stages
+    and the energy is conserved exactly.
     
     Args:
         particle: Particle to update
-        force_func: Function that takes particle and returns force
+        k: Spring constant
+        anchor: Spring anchor point [x, y]
         dt: Time step
     """
-    # Store original state
-    pos0 = particle.position.copy()
-    vel0 = particle.velocity.copy()
+    omega = math.sqrt(k / particle.mass)
+    c, s = math.cos(omega * dt), math.sin(omega * dt)
+    position, velocity = particle.position, particle.velocity
+    for axis in range(len(position)):
+        offset = position[axis] - anchor[axis]
+        v = velocity[axis]
+        position[axis] = anchor[axis] + offset * c + v / omega * s
+        velocity[axis] = v * c - offset * omega * s
+
+
+def rk4_step_2d(
+    particle: 'Particle',
+    force_func: Callable,
+    dt: float
+) -> None:
+    """
+    RK4 step for a 2-D particle, unrolled into scalar arithmetic
+    
+    With only two components, Python float math is cheaper than dispatching
+    NumPy ufuncs, so the stages run on floats (via tolist) and are written
+    back into the particle's arrays in place.
     
-    # k1
-    f1 = force_func(particle)
-    a1 = f1 / particle.mass
-    v1 = vel0
+    Args:
+        particle: Particle to update (position and velocity of length 2)
+        force_func: Function that takes particle and returns a force array
+        dt: Time step
+    """
+    position, velocity = particle.position, particle.velocity
+    inv_mass = 1.0 / particle.mass
+    half_dt = 0.5 * dt
+    sixth_dt = dt / 6.0
+    x0, y0 = position.tolist()
+    vx0, vy0 = velocity.tolist()
+    
+    # k1 (v1 = v0)
+    fx, fy = force_func(particle).tolist()
+    ax1, ay1 = fx * inv_mass, fy * inv_mass
     
     # k2
-    particle.position = pos0 + 0.5 * v1 * dt
-    particle.velocity = vel0 + 0.5 * a1 * dt
-    f2 = force_func(particle)
-    a2 = f2 / particle.mass
-    v2 = vel0 + 0.5 * a1 * dt
+    vx2, vy2 = vx0 + half_dt * ax1, vy0 + half_dt * ay1
+    position[0], position[1] = x0 + half_dt * vx0, y0 + half_dt * vy0
+    velocity[0], velocity[1] = vx2, vy2
+    fx, fy = force_func(particle).tolist()
+    ax2, ay2 = fx * inv_mass, fy * inv_mass
     
     # k3
-    particle.position = pos0 + 0.5 * v2 * dt
-    particle.velocity = vel0 + 0.5 * a2 * dt
-    f3 = force_func(particle)
-    a3 = f3 / particle.mass
-    v3 = vel0 + 0.5 * a2 * dt
+    vx3, vy3 = vx0 + half_dt * ax2, vy0 + half_dt * ay2
+    position[0], position[1] = x0 + half_dt * vx2, y0 + half_dt * vy2
+    velocity[0], velocity[1] = vx3, vy3
+    fx, fy = force_func(particle).tolist()
+    ax3, ay3 = fx * inv_mass, fy * inv_mass
     
     # k4
-    particle.position = pos0 + v3 * dt
-    particle.velocity = vel0 + a3 * dt
-    f4 = force_func(particle)
-    a4 = f4 / particle.mass
-    v4 = vel0 + a3 * dt
-    
-    # Combine
-    particle.position = pos0 + (dt / 6) * (v1 + 2*v2 + 2*v3 + v4)
-    particle.velocity = vel0 + (dt / 6) * (a1 + 2*a2 + 2*a3 + a4)
+    vx4, vy4 = vx0 + dt * ax3, vy0 + dt * ay3
+    position[0], position[1] = x0 + dt * vx3, y0 + dt * vy3
+    velocity[0], velocity[1] = vx4, vy4
+    fx, fy = force_func(particle).tolist()
+    ax4, ay4 = fx * inv_mass, fy * inv_mass
+    
+    # Combine: x += dt/6 * (v1 + 2*v2 + 2*v3 + v4), likewise for v
+    position[0] = x0 + sixth_dt * (vx0 + 2.0 * (vx2 + vx3) + vx4)
+    position[1] = y0 + sixth_dt * (vy0 + 2.0 * (vy2 + vy3) + vy4)
+    velocity[0] = vx0 + sixth_dt * (ax1 + 2.0 * (ax2 + ax3) + ax4)
+    velocity[1] = vy0 + sixth_dt * (ay1 + 2.0 * (ay2 + ay3) + ay4)
+
+
+def _rk4_step_scalar(
+    particle: ScalarParticle,
+    force_func: Callable,
+    dt: float
+) -> None:
+    """rk4_step_2d on a ScalarParticle's float fields"""
+    inv_mass = 1.0 / particle.mass
+    half_dt = 0.5 * dt
+    sixth_dt = dt / 6.0
+    x0, y0, vx0, vy0 = particle.x, particle.y, particle.vx, particle.vy
+    
+    # k1 (v1 = v0)
+    fx, fy = force_func(particle)
+    ax1, ay1 = fx * inv_mass, fy * inv_mass
+    
+    # k2
+    vx2, vy2 = vx0 + half_dt * ax1, vy0 + half_dt * ay1
+    particle.x, particle.y = x0 + half_dt * vx0, y0 + half_dt * vy0
+    particle.vx, particle.vy = vx2, vy2
+    fx, fy = force_func(particle)
+    ax2, ay2 = fx * inv_mass, fy * inv_mass
+    
+    # k3
+    vx3, vy3 = vx0 + half_dt * ax2, vy0 + half_dt * ay2
+    particle.x, particle.y = x0 + half_dt * vx2, y0 + half_dt * vy2
+    particle.vx, particle.vy = vx3, vy3
+    fx, fy = force_func(particle)
+    ax3, ay3 = fx * inv_mass, fy * inv_mass
+    
+    # k4
+    vx4, vy4 = vx0 + dt * ax3, vy0 + dt * ay3
+    particle.x, particle.y = x0 + dt * vx3, y0 + dt * vy3
+    particle.vx, particle.vy = vx4, vy4
+    fx, fy = force_func(particle)
+    ax4, ay4 = fx * inv_mass, fy * inv_mass
+    
+    particle.x = x0 + sixth_dt * (vx0 + 2.0 * (vx2 + vx3) + vx4)
+    particle.y = y0 + sixth_dt * (vy0 + 2.0 * (vy2 + vy3) + vy4)
+    particle.vx = vx0 + sixth_dt * (ax1 + 2.0 * (ax2 + ax3) + ax4)
+    particle.vy = vy0 + sixth_dt * (ay1 + 2.0 * (ay2 + ay3) + ay4)
+
+
+# Exact updates used by rk4_step in place of the generic stages, keyed on
+# the force function; each takes (particle, dt)
+CLOSED_FORM_STEPS: Dict[Callable, Callable] = {
+    gravity_force: lambda particle, dt: rk4_step_gravity(particle, G_EARTH, dt),
+}
+
+# One integrator per thread so concurrent simulations don't share buffers
+_local = threading.local()
+
+
+def rk4_step(
+    particle: 'Particle',
+    force_func: Callable,
+    dt: float
+) -> None:
+    """
+    Update particle state using 4th order Runge-Kutta integration
+    
+    Args:
+        particle: Particle to update
+        force_func: Function that takes particle and returns force
+        dt: Time step
+    """
+    if isinstance(particle, ScalarParticle):
+        _rk4_step_scalar(particle, force_func, dt)
+        return
+    
+    closed_form = CLOSED_FORM_STEPS.get(force_func)
+    if closed_form is not None:
+        closed_form(particle, dt)
+        return
+    
+    if particle.position.shape == (2,):
+        rk4_step_2d(particle, force_func, dt)
+        return
+    
+    integrator = getattr(_local, "rk4", None)
+    if integrator is None:
+        integrator = _local.rk4 = RK4Integrator()
+    integrator.step(particle, force_func, dt)
@@ -25,8 +25,34 @@ class Particle:
         self.velocity = np.array(velocity if velocity else [0.0, 0.0], dtype=float)
         self.acceleration = np.array([0.0, 0.0], dtype=float)
         
+    @classmethod
+    def view(
+        cls,
+        mass: float,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        acceleration: np.ndarray
+    ) -> 'Particle':
+        """
+        Create a particle backed by existing arrays (no copies)
+        
+        Used by ParticleSystem to expose one row of its arrays as a Particle;
+        in-place updates to the particle write through to the system.
+        """
+        particle = cls.__new__(cls)
+        particle.mass = mass
+        particle.position = position
+        particle.velocity = velocity
+        particle.acceleration = acceleration
+        return particle
+        
     def apply_force(self, force: np.ndarray) -> None:
-        """Apply force to particle using F = ma"""
+        """
+        Apply force to particle using F = ma
+        
+        Integrators compute F/m themselves and never call this, so
+        acceleration only reflects the last force applied here.
+        """
         self.acceleration = force / self.mass
         
     def kinetic_energy(self) -> float:
@@ -42,3 +68,77 @@ class Particle:
         return (f"Particle(mass={self.mass}, "
                 f"pos={self.position}, "
                 f"vel={self.velocity})")
+
+
+class ScalarParticle:
+    """
+    2-D particle stored as plain float attributes
+    
+    A lighter alternative to Particle for single-particle loops: __slots__
+    drops the instance dict and scalar math skips NumPy dispatch. The
+    position, velocity and acceleration properties build arrays on demand
+    for code written against Particle; euler_step and rk4_step update the
+    scalar fields directly.
+    """
+    __slots__ = ('mass', 'x', 'y', 'vx', 'vy', 'ax', 'ay')
+    
+    def __init__(
+        self, 
+        mass: float = 1.0,
+        position: List[float] = None,
+        velocity: List[float] = None
+    ):
+        """
+        Initialize a particle
+        
+        Args:
+            mass: Particle mass in kg
+            position: Initial position [x, y] in meters
+            velocity: Initial velocity [vx, vy] in m/s
+        """
+        self.mass = mass
+        self.x, self.y = map(float, position if position else (0.0, 0.0))
+        self.vx, self.vy = map(float, velocity if velocity else (0.0, 0.0))
+        self.ax = self.ay = 0.0
+        
+    @property
+    def position(self) -> np.ndarray:
+        """Position [x, y] as a new array"""
+        return np.array([self.x, self.y])
+        
+    @position.setter
+    def position(self, value: List[float]) -> None:
+        self.x, self.y = map(float, value)
+        
+    @property
+    def velocity(self) -> np.ndarray:
+        """Velocity [vx, vy] as a new array"""
+        return np.array([self.vx, self.vy])
+        
+    @velocity.setter
+    def velocity(self, value: List[float]) -> None:
+        self.vx, self.vy = map(float, value)
+        
+    @property
+    def acceleration(self) -> np.ndarray:
+        """Acceleration [ax, ay] as a new array"""
+        return np.array([self.ax, self.ay])
+        
+    def apply_force(self, force: np.ndarray) -> None:
+        """Apply force to particle using F = ma"""
+        fx, fy = force
+        self.ax = fx / self.mass
+        self.ay = fy / self.mass
+        
+    def kinetic_energy(self) -> float:
+        """Calculate kinetic energy: KE = 0.5 * m * v^2"""
+        return 0.5 * self.mass * (self.vx * self.vx + self.vy * self.vy)
+        
+    def momentum(self) -> np.ndarray:
+        """Calculate momentum: p = m * v"""
+        return np.array([self.mass * self.vx, self.mass * self.vy])
+        
+    def __repr__(self) -> str:
+        return (f"ScalarParticle(mass={self.mass}, "
+                f"pos=({self.x}, {self.y}), "
+                f"vel=({self.vx}, {self.vy}))")
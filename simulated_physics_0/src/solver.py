@@ -13,26 +13,34 @@ class VerletSolver:
     """
     Verlet integration solver.
     Maintains state required for Verlet integration (previous position).
+    A solver tracks a single particle; use one solver per particle (or a
+    ParticleSystem for many). Stepping a different particle raises.
     """
     def __init__(self, dt: float):
         self.dt = dt
-        self.previous_positions = {}  # Map particle ID to previous position
+        self._particle = None  # Particle being integrated, set on the first step
+        self._prev = np.empty(2)  # Position at the previous step
+        self._current = np.empty(2)  # Scratch copy of the position being replaced
 
     def step(self, particle: 'Particle', force: np.ndarray) -> None:
         """
         Advance the particle by one time step.
         """
-        # Use object id as key for simple state tracking
-        pid = id(particle)
-        prev_pos = self.previous_positions.get(pid)
-        
+        if self._particle is None:
+            self._particle = particle
+            prev_pos = None
+        elif particle is self._particle:
+            prev_pos = self._prev
+        else:
+            raise ValueError("VerletSolver tracks a single particle; use one solver per particle")
+
         # Store current position before update to become next previous
-        current_pos = particle.position.copy()
-        
+        np.copyto(self._current, particle.position)
+
         verlet_step(particle, force, self.dt, prev_pos)
-        
-        # Update previous position for next step
-        self.previous_positions[pid] = current_pos
+
+        # The replaced position becomes the next step's previous position
+        self._prev, self._current = self._current, self._prev
 
 class EulerSolver:
     """
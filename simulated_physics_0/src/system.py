@@ -0,0 +1,115 @@
+"""Structure-of-arrays storage for many particles"""
+import numpy as np
+from typing import List, Sequence
+
+from .forces import G_EARTH, friction_force_batch, gravity_force_batch
+from .particle import Particle
+
+
+class ParticleSystem:
+    """
+    N particles stored as contiguous arrays instead of N Particle objects
+
+    Positions, velocities and accelerations are (N, 2) float64 arrays and
+    masses an (N,) array, so forces and integration are a handful of
+    vectorized, in-place NumPy operations per step.
+    """
+
+    def __init__(
+        self,
+        masses: Sequence[float],
+        positions: Sequence[Sequence[float]],
+        velocities: Sequence[Sequence[float]] = None
+    ):
+        """
+        Initialize a particle system
+
+        Args:
+            masses: Particle masses in kg, shape (N,)
+            positions: Initial positions in meters, shape (N, 2)
+            velocities: Initial velocities in m/s, shape (N, 2) (default: at rest)
+        """
+        self.mass = np.array(masses, dtype=float).reshape(-1)
+        n = len(self.mass)
+        self.pos = np.array(positions, dtype=float).reshape(n, 2)
+        if velocities is None:
+            self.vel = np.zeros((n, 2))
+        else:
+            self.vel = np.array(velocities, dtype=float).reshape(n, 2)
+        self.acc = np.zeros((n, 2))
+
+        # Reused scratch buffers so a step allocates nothing
+        self.force = np.zeros((n, 2))
+        self._work = np.empty((2, n))
+        self._tmp = np.empty((n, 2))
+        self._mass_col = self.mass[:, None]
+
+    @classmethod
+    def from_particles(cls, particles: List[Particle]) -> 'ParticleSystem':
+        """Pack existing particles into a system (their state is copied)"""
+        return cls(
+            [p.mass for p in particles],
+            [p.position for p in particles],
+            [p.velocity for p in particles]
+        )
+
+    def __len__(self) -> int:
+        return len(self.mass)
+
+    def particle(self, i: int) -> Particle:
+        """Particle whose position/velocity/acceleration are views of row i"""
+        return Particle.view(
+            float(self.mass[i]), self.pos[i], self.vel[i], self.acc[i]
+        )
+
+    def gravity_force(self, g: float = G_EARTH, out: np.ndarray = None) -> np.ndarray:
+        """
+        Gravitational force on every particle
+
+        Args:
+            g: Gravitational acceleration
+            out: Buffer to write into (default: the system's force buffer)
+
+        Returns:
+            Force array, shape (N, 2)
+        """
+        out = self.force if out is None else out
+        return gravity_force_batch(self.mass, g, out=out)
+
+    def friction_force(
+        self,
+        coefficient: float = 0.1,
+        out: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Friction force (simplified drag model) on every particle
+
+        Args:
+            coefficient: Friction coefficient
+            out: Buffer to write into (default: the system's force buffer)
+
+        Returns:
+            Force array, shape (N, 2)
+        """
+        out = self.force if out is None else out
+        return friction_force_batch(
+            self.vel, self.mass, coefficient, out=out, work=self._work
+        )
+
+    def euler_step(self, force: np.ndarray, dt: float) -> None:
+        """
+        Advance all particles one Euler step in place
+
+        Args:
+            force: Net force on each particle, shape (N, 2)
+            dt: Time step
+        """
+        np.divide(force, self._mass_col, out=self.acc)
+        np.multiply(self.acc, dt, out=self._tmp)
+        self.vel += self._tmp
+        np.multiply(self.vel, dt, out=self._tmp)
+        self.pos += self._tmp
+
+    def kinetic_energy(self) -> np.ndarray:
+        """Kinetic energy of each particle: KE = 0.5 * m * v^2"""
+        return 0.5 * self.mass * np.einsum('ij,ij->i', self.vel, self.vel)
@@ -1,7 +1,7 @@
 """Visualization utilities for physics simulations"""
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.animation import FuncAnimation, writers
 from typing import List
 
 
@@ -14,11 +14,11 @@ def plot_trajectory(
     Plot particle trajectory
     
     Args:
-        positions: List of position vectors
+        positions: Position vectors, ideally an (N, 2) array
         title: Plot title
         save_path: Optional path to save figure
     """
-    positions = np.array(positions)
+    positions = np.asarray(positions)  # No copy when already an array
     
     plt.figure(figsize=(10, 6))
     plt.plot(positions[:, 0], positions[:, 1], 'b-', alpha=0.6, label='Path')
@@ -108,20 +108,22 @@ def animate_simulation(
     Create animation of particle motion
     
     Args:
-        positions: List of position vectors
+        positions: Position vectors, ideally an (N, 2) array
         interval: Milliseconds between frames
-        save_path: Optional path to save animation
+        save_path: Optional path to save animation; encoded as H.264 with
+            ffmpeg when available, with Pillow for .gif paths or without ffmpeg
         
     Returns:
         Animation object
     """
-    positions = np.array(positions)
+    positions = np.asarray(positions)  # No copy when already an array
     
     fig, ax = plt.subplots(figsize=(10, 8))
     
     # Set up plot limits
-    x_min, x_max = positions[:, 0].min(), positions[:, 0].max()
-    y_min, y_max = positions[:, 1].min(), positions[:, 1].max()
+    xs, ys = positions[:, 0], positions[:, 1]
+    x_min, x_max = xs.min(), xs.max()
+    y_min, y_max = ys.min(), ys.max()
     margin = 0.1
     ax.set_xlim(x_min - margin, x_max + margin)
     ax.set_ylim(y_min - margin, y_max + margin)
@@ -141,8 +143,8 @@ def animate_simulation(
         return trail, particle
     
     def update(frame):
-        trail.set_data(positions[:frame, 0], positions[:frame, 1])
-        particle.set_data([positions[frame, 0]], [positions[frame, 1]])
+        trail.set_data(xs[:frame], ys[:frame])
+        particle.set_data(xs[frame:frame + 1], ys[frame:frame + 1])
         return trail, particle
     
     anim = FuncAnimation(
@@ -152,6 +154,9 @@ def animate_simulation(
     )
     
     if save_path:
-        anim.save(save_path, writer='pillow', fps=20)
+        if not save_path.endswith('.gif') and writers.is_available('ffmpeg'):
+            anim.save(save_path, writer='ffmpeg', fps=20, codec='h264', dpi=100)
+        else:
+            anim.save(save_path, writer='pillow', fps=20)
     
     return anim
@@ -1,9 +1,7 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
-from src.particle import Particle
-from src.forces import Gravity, SpringForce, DragForce
-from src.solver import VerletSolver
+from src.kernels import simulate_verlet
 
 st.set_page_config(page_title="Physics Lab", page_icon="⚛️")
 
@@ -29,18 +27,16 @@ use_gravity = st.sidebar.checkbox("Gravity", True)
 use_drag = st.sidebar.checkbox("Air Resistance", False)
 use_spring = st.sidebar.checkbox("Spring (to origin)", False)
 
-forces = []
+# Disabled forces contribute nothing to the kernel
+g = c = k = 0.0
 if use_gravity:
     g = st.sidebar.slider("Gravity (m/s²)", 0.0, 20.0, 9.81)
-    forces.append(Gravity(g=g))
 
 if use_drag:
     c = st.sidebar.slider("Drag Coefficient", 0.0, 1.0, 0.1)
-    forces.append(DragForce(c=c))
 
 if use_spring:
     k = st.sidebar.slider("Spring Constant (k)", 0.1, 10.0, 1.0)
-    forces.append(SpringForce(k=k, anchor=(0,0)))
 
 # Simulation Parameters
 dt = 0.01
@@ -48,34 +44,22 @@ t_max = st.sidebar.slider("Simulation Time (s)", 1.0, 20.0, 5.0)
 steps = int(t_max / dt)
 
 if st.button("Run Simulation"):
-    # Setup
-    p = Particle(mass=mass, position=[x0, y0], velocity=[vx0, vy0])
-    solver = VerletSolver(dt=dt)
+    # Run the whole loop in one compiled call
+    trajectory_x, trajectory_y = simulate_verlet(
+        x0, y0, vx0, vy0, mass, g, c, k, 0.0, 0.0, dt, steps, 0.8
+    )
+    times = np.arange(steps) * dt
     
-    # Run
-    trajectory_x = []
-    trajectory_y = []
-    times = []
-    
-    for i in range(steps):
-        trajectory_x.append(p.position[0])
-        trajectory_y.append(p.position[1])
-        times.append(i * dt)
-        
-        # Calculate net force
-        net_force = np.zeros(2)
-        for f in forces:
-            net_force += f.apply(p)
-            
-        solver.step(p, net_force)
-        
-        # Ground collision
-        if p.position[1] < 0:
-            p.position[1] = 0
-            p.velocity[1] *= -0.8 # Bounce
-            
-    # Plot
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 10))
+    # Plot on the session's figure; creating a new one costs more than the run
+    if 'fig' not in st.session_state:
+        st.session_state.fig, (st.session_state.ax1, st.session_state.ax2) = (
+            plt.subplots(2, 1, figsize=(8, 10))
+        )
+    fig = st.session_state.fig
+    ax1 = st.session_state.ax1
+    ax2 = st.session_state.ax2
+    ax1.clear()
+    ax2.clear()
     
     # Trajectory
     ax1.plot(trajectory_x, trajectory_y, 'b-', label='Path')
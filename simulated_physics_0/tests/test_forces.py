@@ -3,7 +3,9 @@ import pytest
 import numpy as np
 from src.particle import Particle
 from src.forces import (
-    gravity_force, friction_force, spring_force, net_force, G_EARTH
+    gravity_force, friction_force, spring_force, net_force, net_force_inplace,
+    gravity_force_batch, friction_force_batch, spring_force_batch, G_EARTH,
+    FrictionForce, SpringForce
 )
 
 
@@ -26,6 +28,16 @@ def test_gravity_force_custom_g():
     assert np.allclose(force, expected)
 
 
+def test_gravity_force_out_buffer():
+    """Test gravity writes into a provided buffer"""
+    p = Particle(mass=2.0)
+    out = np.array([5.0, 5.0])
+    force = gravity_force(p, out=out)
+    
+    assert force is out
+    assert np.allclose(out, [0.0, -2.0 * G_EARTH])
+
+
 def test_friction_force_stationary():
     """Test friction is zero for stationary particle"""
     p = Particle(mass=1.0, velocity=[0.0, 0.0])
@@ -91,6 +103,58 @@ def test_spring_force_compressed():
     assert force[0] > 0  # Points away from anchor
 
 
+def make_particles():
+    return [
+        Particle(mass=1.0, position=[0.0, 10.0], velocity=[2.0, 0.0]),
+        Particle(mass=3.0, position=[5.0, 1.0], velocity=[0.0, -1.5]),
+        Particle(mass=2.0, position=[0.0, 0.0], velocity=[0.0, 0.0]),
+    ]
+
+
+def test_batch_forces_match_per_particle():
+    """Test batched forces agree with the per-particle functions"""
+    particles = make_particles()
+    mass = np.array([p.mass for p in particles])
+    pos = np.array([p.position for p in particles])
+    vel = np.array([p.velocity for p in particles])
+    anchor = np.zeros(2)
+    
+    gravity = gravity_force_batch(mass)
+    friction = friction_force_batch(vel, mass, coefficient=0.2)
+    spring = spring_force_batch(pos, anchor, k=4.0, rest_length=1.0)
+    
+    for i, p in enumerate(particles):
+        assert np.allclose(gravity[i], gravity_force(p))
+        assert np.allclose(friction[i], friction_force(p, coefficient=0.2))
+        assert np.allclose(spring[i], spring_force(p, anchor, k=4.0, rest_length=1.0))
+
+
+def test_batch_forces_write_into_out():
+    """Test batched forces fill a provided buffer"""
+    particles = make_particles()
+    pos = np.array([p.position for p in particles])
+    out = np.full((3, 2), np.nan)
+    
+    result = spring_force_batch(pos, np.array([1.0, 1.0]), out=out)
+    
+    assert result is out
+    assert np.all(np.isfinite(out))
+
+
+def test_force_objects_match_force_functions():
+    """Test precomputed force objects agree with the plain functions"""
+    anchor = np.array([1.0, 1.0])
+    friction = FrictionForce(coefficient=0.2, mass=3.0)
+    spring = SpringForce(k=4.0, anchor=anchor, rest_length=1.0)
+    out = np.empty(2)
+    
+    for p in make_particles():
+        if p.mass == 3.0:
+            assert np.allclose(friction(p), friction_force(p, coefficient=0.2))
+        assert spring(p, out=out) is out
+        assert np.allclose(out, spring_force(p, anchor, k=4.0, rest_length=1.0))
+
+
 def test_net_force_single():
     """Test net force with single force"""
     f1 = np.array([1.0, 2.0])
@@ -109,6 +173,15 @@ def test_net_force_multiple():
     assert np.allclose(result, expected)
 
 
+def test_net_force_inplace_reuses_buffer():
+    """Test in-place net force overwrites the given buffer"""
+    out = np.array([100.0, 100.0])
+    result = net_force_inplace(out, np.array([1.0, 2.0]), np.array([3.0, -1.0]))
+    
+    assert result is out
+    assert np.allclose(out, [4.0, 1.0])
+
+
 def test_combined_forces():
     """Test realistic combination of forces"""
     p = Particle(mass=1.0, position=[0, 10], velocity=[2.0, 0])
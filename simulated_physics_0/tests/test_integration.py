@@ -2,8 +2,11 @@
 import pytest
 import numpy as np
 from src.particle import Particle
-from src.integrator import euler_step, verlet_step, rk4_step
-from src.forces import gravity_force
+from src.integrator import (
+    euler_step, euler_step_inplace, verlet_step, rk4_step, RK4Integrator,
+    rk4_step_gravity, rk4_step_spring, rk4_step_2d
+)
+from src.forces import gravity_force, spring_force
 
 
 def test_euler_step_updates_position():
@@ -153,3 +156,104 @@ def test_different_timesteps():
     assert p2.position[1] < 10
     assert p1.velocity[1] < 0
     assert p2.velocity[1] < 0
+
+
+def test_euler_step_inplace_reuses_arrays():
+    """Test in-place Euler matches euler_step without rebinding arrays"""
+    p1 = Particle(mass=2.0, position=[0, 10], velocity=[5, 0])
+    p2 = Particle(mass=2.0, position=[0, 10], velocity=[5, 0])
+    force = np.array([1.0, -19.62])
+    scratch = np.empty(2)
+    position, velocity = p2.position, p2.velocity
+    
+    for _ in range(10):
+        euler_step(p1, force, 0.01)
+        euler_step_inplace(p2, force, 0.01, scratch)
+    
+    assert p2.position is position
+    assert p2.velocity is velocity
+    assert np.allclose(p1.position, p2.position)
+    assert np.allclose(p1.velocity, p2.velocity)
+
+
+def test_integrators_leave_acceleration_untouched():
+    """Test integrators no longer write particle.acceleration"""
+    p = Particle(position=[0, 10], velocity=[5, 0])
+    force = np.array([0, -9.81])
+    
+    euler_step(p, force, 0.01)
+    verlet_step(p, force, 0.01, p.position - p.velocity * 0.01)
+    rk4_step(p, gravity_force, 0.01)
+    assert np.allclose(p.acceleration, [0.0, 0.0])
+    
+    p.apply_force(force)
+    assert np.allclose(p.acceleration, force / p.mass)
+
+
+def test_rk4_integrator_matches_rk4_step():
+    """Test the buffered RK4 integrator agrees with rk4_step"""
+    p1 = Particle(mass=1.0, position=[1, 0], velocity=[0, 2])
+    p2 = Particle(mass=1.0, position=[1, 0], velocity=[0, 2])
+    anchor = np.array([0.0, 0.0])
+    
+    def force_func(particle):
+        return spring_force(particle, anchor, k=4.0)
+    
+    integrator = RK4Integrator()
+    for _ in range(100):
+        rk4_step(p1, force_func, 0.01)
+        integrator.step(p2, force_func, 0.01)
+    
+    assert np.allclose(p1.position, p2.position)
+    assert np.allclose(p1.velocity, p2.velocity)
+
+
+def test_rk4_step_gravity_matches_generic_rk4():
+    """Test the gravity closed form agrees with generic RK4"""
+    p1 = Particle(mass=2.0, position=[0, 10], velocity=[3, 1])
+    p2 = Particle(mass=2.0, position=[0, 10], velocity=[3, 1])
+    integrator = RK4Integrator()
+    
+    for _ in range(20):
+        rk4_step_gravity(p1, 9.81, 0.05)
+        integrator.step(p2, gravity_force, 0.05)
+    
+    assert np.allclose(p1.position, p2.position)
+    assert np.allclose(p1.velocity, p2.velocity)
+
+
+def test_rk4_step_spring_conserves_energy():
+    """Test the analytic spring step tracks RK4 and conserves energy exactly"""
+    anchor = np.array([0.5, -0.5])
+    p1 = Particle(mass=2.0, position=[1, 0], velocity=[0, 2])
+    p2 = Particle(mass=2.0, position=[1, 0], velocity=[0, 2])
+    
+    def energy(p):
+        offset = p.position - anchor
+        return p.kinetic_energy() + 0.5 * 4.0 * np.dot(offset, offset)
+    
+    initial = energy(p1)
+    for _ in range(100):
+        rk4_step_spring(p1, 4.0, anchor, 0.01)
+        rk4_step(p2, lambda p: spring_force(p, anchor, k=4.0), 0.01)
+    
+    assert energy(p1) == pytest.approx(initial, rel=1e-12)
+    assert np.allclose(p1.position, p2.position, atol=1e-6)
+
+
+def test_rk4_step_2d_matches_buffered_integrator():
+    """Test the unrolled 2-D RK4 step agrees with the vectorized stages"""
+    anchor = np.array([0.0, 0.0])
+    p1 = Particle(mass=1.5, position=[1, 0], velocity=[0, 2])
+    p2 = Particle(mass=1.5, position=[1, 0], velocity=[0, 2])
+    integrator = RK4Integrator()
+    
+    def force_func(particle):
+        return spring_force(particle, anchor, k=3.0) + gravity_force(particle)
+    
+    for _ in range(100):
+        rk4_step_2d(p1, force_func, 0.01)
+        integrator.step(p2, force_func, 0.01)
+    
+    assert np.allclose(p1.position, p2.position)
+    assert np.allclose(p1.velocity, p2.velocity)
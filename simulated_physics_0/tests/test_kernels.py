@@ -0,0 +1,90 @@
+"""Tests for the compiled simulation kernels"""
+import numpy as np
+from src.kernels import (
+    simulate_verlet, simulate_verlet_py, forces_parallel, rk4_step_njit,
+    FORCE_GRAVITY, FORCE_FRICTION, FORCE_SPRING
+)
+from src.forces import (
+    G_EARTH, gravity_force, friction_force, spring_force,
+    gravity_force_batch, friction_force_batch, spring_force_batch
+)
+from src.integrator import RK4Integrator
+from src.particle import Particle
+
+
+def test_simulate_verlet_matches_python_reference():
+    """Test the compiled kernel against its pure Python version"""
+    args = (0.0, 10.0, 5.0, 0.0, 2.0, G_EARTH, 0.3, 1.5, 0.0, 0.0, 0.01, 500, 0.8)
+    x_fast, y_fast = simulate_verlet(*args)
+    x_ref, y_ref = simulate_verlet_py(*args)
+    
+    np.testing.assert_allclose(x_fast, x_ref, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(y_fast, y_ref, rtol=1e-9, atol=1e-9)
+
+
+def test_simulate_verlet_free_fall():
+    """Test that gravity alone gives y = y0 - g*t^2/2"""
+    dt, steps = 0.001, 1000
+    traj_x, traj_y = simulate_verlet(
+        0.0, 10.0, 2.0, 0.0, 1.0, G_EARTH, 0.0, 0.0, 0.0, 0.0, dt, steps, 0.8
+    )
+    t = (steps - 1) * dt
+    
+    assert traj_x.shape == traj_y.shape == (steps,)
+    assert np.isclose(traj_x[-1], 2.0 * t)
+    assert np.isclose(traj_y[-1], 10.0 - 0.5 * G_EARTH * t**2, atol=1e-2)
+
+
+def test_simulate_verlet_stays_above_ground():
+    """Test that the particle bounces instead of falling through y = 0"""
+    _, traj_y = simulate_verlet(
+        0.0, 1.0, 0.0, 0.0, 1.0, G_EARTH, 0.0, 0.0, 0.0, 0.0, 0.01, 1000, 0.8
+    )
+    
+    assert traj_y.min() >= 0.0
+    assert traj_y[200:].max() > 0.1
+
+
+def test_forces_parallel_matches_batch_forces():
+    """Test the parallel force kernel against the vectorized NumPy forces"""
+    rng = np.random.default_rng(0)
+    n = 1000
+    pos = rng.normal(size=(n, 2))
+    vel = rng.normal(size=(n, 2))
+    vel[0] = 0.0  # Stationary particle feels no friction
+    mass = rng.uniform(0.5, 3.0, size=n)
+    anchor = np.array([0.5, -0.5])
+    
+    out = np.empty((n, 2))
+    result = forces_parallel(pos, vel, mass, G_EARTH, 0.2, 3.0, anchor, out)
+    expected = (
+        gravity_force_batch(mass)
+        + friction_force_batch(vel, mass, coefficient=0.2)
+        + spring_force_batch(pos, anchor, k=3.0)
+    )
+    
+    assert result is out
+    np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_rk4_step_njit_matches_rk4_with_force_functions():
+    """Test the compiled RK4 step against RK4 with the Python forces"""
+    anchor = np.array([0.5, 1.0])
+    
+    def force_func(particle):
+        return (
+            gravity_force(particle)
+            + friction_force(particle, coefficient=0.1)
+            + spring_force(particle, anchor, k=2.0)
+        )
+    
+    p = Particle(mass=1.5, position=[1.0, 3.0], velocity=[2.0, 0.0])
+    pos, vel = p.position.copy(), p.velocity.copy()
+    integrator = RK4Integrator()
+    kind = FORCE_GRAVITY | FORCE_FRICTION | FORCE_SPRING
+    for _ in range(100):
+        integrator.step(p, force_func, 0.01)
+        rk4_step_njit(pos, vel, 1.5, 0.01, kind, G_EARTH, 0.1, 2.0, anchor, pos, vel)
+    
+    np.testing.assert_allclose(pos, p.position, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(vel, p.velocity, rtol=1e-9, atol=1e-9)
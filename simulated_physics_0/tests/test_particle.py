@@ -1,7 +1,9 @@
 """Tests for Particle class"""
 import pytest
 import numpy as np
-from src.particle import Particle
+from src.particle import Particle, ScalarParticle
+from src.forces import spring_force
+from src.integrator import euler_step, rk4_step
 
 
 def test_particle_initialization():
@@ -54,3 +56,34 @@ def test_momentum_conservation():
     """Test that momentum equals mass times velocity"""
     p = Particle(mass=5.0, velocity=[1.0, -2.0])
     assert np.allclose(p.momentum(), p.mass * p.velocity)
+
+
+def test_scalar_particle_matches_particle():
+    """Test ScalarParticle exposes the same state and energy as Particle"""
+    p = Particle(mass=2.0, position=[1.0, 2.0], velocity=[3.0, 4.0])
+    s = ScalarParticle(mass=2.0, position=[1.0, 2.0], velocity=[3.0, 4.0])
+    
+    assert not hasattr(s, '__dict__')
+    assert np.allclose(s.position, p.position)
+    assert np.allclose(s.velocity, p.velocity)
+    assert s.kinetic_energy() == pytest.approx(p.kinetic_energy())
+    assert np.allclose(s.momentum(), p.momentum())
+
+
+def test_scalar_particle_integrates_like_particle():
+    """Test euler_step and rk4_step give the same trajectory for both types"""
+    anchor = np.array([0.0, 0.0])
+    
+    def force_func(particle):
+        return spring_force(particle, anchor, k=2.0)
+    
+    p = Particle(mass=1.5, position=[1.0, 0.0], velocity=[0.0, 1.0])
+    s = ScalarParticle(mass=1.5, position=[1.0, 0.0], velocity=[0.0, 1.0])
+    for _ in range(50):
+        rk4_step(p, force_func, 0.01)
+        rk4_step(s, force_func, 0.01)
+        euler_step(p, force_func(p), 0.01)
+        euler_step(s, force_func(s), 0.01)
+    
+    assert np.allclose(s.position, p.position)
+    assert np.allclose(s.velocity, p.velocity)
@@ -0,0 +1,49 @@
+"""Tests for the class-based solver adapters"""
+import pytest
+import numpy as np
+from src.particle import Particle
+from src.forces import gravity_force, spring_force
+from src.integrator import verlet_step
+from src.solver import VerletSolver
+
+
+def test_verlet_solver_matches_verlet_step():
+    """Test the solver reproduces manual Verlet stepping"""
+    dt = 0.01
+    p_solver = Particle(mass=2.0, position=[1.0, 0.0], velocity=[0.0, 1.0])
+    p_manual = Particle(mass=2.0, position=[1.0, 0.0], velocity=[0.0, 1.0])
+    solver = VerletSolver(dt=dt)
+    
+    prev = None
+    for _ in range(50):
+        solver.step(p_solver, spring_force(p_solver, anchor=np.zeros(2), k=3.0))
+        
+        current = p_manual.position.copy()
+        verlet_step(p_manual, spring_force(p_manual, anchor=np.zeros(2), k=3.0), dt, prev)
+        prev = current
+    
+    assert np.allclose(p_solver.position, p_manual.position)
+    assert np.allclose(p_solver.velocity, p_manual.velocity)
+
+
+def test_verlet_solver_does_not_alias_particle_position():
+    """Test the stored previous position is a copy, not the live array"""
+    p = Particle(position=[0, 10], velocity=[1, 0])
+    solver = VerletSolver(dt=0.1)
+    
+    for _ in range(3):
+        solver.step(p, gravity_force(p))
+    
+    assert not np.shares_memory(solver._prev, p.position)
+    assert not np.allclose(solver._prev, p.position)
+
+
+def test_verlet_solver_rejects_second_particle():
+    """Test a solver refuses to mix the histories of two particles"""
+    solver = VerletSolver(dt=0.01)
+    p1 = Particle(position=[0, 10])
+    p2 = Particle(position=[5, 10])
+    solver.step(p1, gravity_force(p1))
+    
+    with pytest.raises(ValueError):
+        solver.step(p2, gravity_force(p2))
@@ -0,0 +1,89 @@
+"""Tests for the structure-of-arrays ParticleSystem"""
+import numpy as np
+from src.particle import Particle
+from src.system import ParticleSystem
+from src.forces import gravity_force, friction_force
+from src.integrator import euler_step
+from src.solver import VerletSolver
+
+
+def make_particles():
+    return [
+        Particle(mass=1.0, position=[0, 10], velocity=[2.0, 0.0]),
+        Particle(mass=3.0, position=[5, 1], velocity=[0.0, -1.5]),
+        Particle(mass=2.0, position=[-1, 4], velocity=[0.0, 0.0]),
+    ]
+
+
+def test_from_particles_copies_state():
+    """Test packing particles into contiguous arrays"""
+    particles = make_particles()
+    system = ParticleSystem.from_particles(particles)
+    
+    assert len(system) == 3
+    assert system.pos.shape == (3, 2)
+    assert system.pos.flags['C_CONTIGUOUS']
+    assert np.allclose(system.mass, [1.0, 3.0, 2.0])
+    assert np.allclose(system.vel[1], [0.0, -1.5])
+
+
+def test_particle_view_writes_through():
+    """Test particle views share memory with the system"""
+    system = ParticleSystem([1.0], [[0.0, 0.0]], [[1.0, 0.0]])
+    p = system.particle(0)
+    
+    p.position += [1.0, 2.0]
+    assert np.allclose(system.pos[0], [1.0, 2.0])
+
+
+def test_verlet_solver_updates_system_rows():
+    """Test Verlet steps on a particle view write through to the system"""
+    system = ParticleSystem([1.0], [[0.0, 10.0]], [[1.0, 0.0]])
+    p = system.particle(0)
+    solver = VerletSolver(dt=0.1)
+    
+    for _ in range(3):
+        solver.step(p, gravity_force(p))
+    
+    assert np.shares_memory(p.position, system.pos)
+    assert np.allclose(system.pos[0], p.position)
+    assert np.allclose(system.vel[0], p.velocity)
+    assert np.isclose(system.pos[0, 0], 0.3)
+
+
+def test_batched_forces_match_single_particle():
+    """Test vectorized forces agree with per-particle functions"""
+    particles = make_particles()
+    system = ParticleSystem.from_particles(particles)
+    
+    gravity = system.gravity_force().copy()
+    friction = system.friction_force(coefficient=0.2).copy()
+    
+    for i, p in enumerate(particles):
+        assert np.allclose(gravity[i], gravity_force(p))
+        assert np.allclose(friction[i], friction_force(p, coefficient=0.2))
+    
+    # Stationary particle feels no friction
+    assert np.allclose(friction[2], [0.0, 0.0])
+
+
+def test_euler_step_matches_single_particle():
+    """Test vectorized Euler step agrees with per-particle integration"""
+    particles = make_particles()
+    system = ParticleSystem.from_particles(particles)
+    dt = 0.01
+    
+    for _ in range(50):
+        system.euler_step(system.gravity_force(), dt)
+        for p in particles:
+            euler_step(p, gravity_force(p), dt)
+    
+    for i, p in enumerate(particles):
+        assert np.allclose(system.pos[i], p.position)
+        assert np.allclose(system.vel[i], p.velocity)
+
+
+def test_kinetic_energy():
+    """Test per-particle kinetic energy"""
+    system = ParticleSystem([2.0, 1.0], [[0, 0], [0, 0]], [[3.0, 4.0], [0, 0]])
+    assert np.allclose(system.kinetic_energy(), [25.0, 0.0])
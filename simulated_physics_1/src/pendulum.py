@@ -1,5 +1,5 @@
 """Pendulum class for angular motion simulation"""
-import numpy as np
+import math
 
 
 class Pendulum:
@@ -34,13 +34,13 @@ class Pendulum:
         
     def angular_acceleration(self) -> float:
         """Calculate angular acceleration using θ'' = -(g/L)sin(θ) - γω"""
-        gravity_term = -(self.g / self.length) * np.sin(self.angle)
+        gravity_term = -(self.g / self.length) * math.sin(self.angle)
         damping_term = -self.damping * self.angular_velocity
         return gravity_term + damping_term
     
     def potential_energy(self) -> float:
         """PE = mgh = mgL(1 - cos(θ))"""
-        height = self.length * (1 - np.cos(self.angle))
+        height = self.length * (1 - math.cos(self.angle))
         return self.mass * self.g * height
     
     def kinetic_energy(self) -> float:
@@ -54,4 +54,4 @@ class Pendulum:
     
     def period_small_angle(self) -> float:
         """Period using small-angle approximation: T = 2π√(L/g)"""
-        return 2 * np.pi * np.sqrt(self.length / self.g)
+        return 2 * math.pi * math.sqrt(self.length / self.g)
@@ -2,11 +2,15 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from scipy.interpolate import CubicHermiteSpline
 from typing import Dict, Optional
 
+# Upper bound on animation frames, independent of the simulation time step
+ANIMATION_FRAMES = 500
+
 
 def plot_results(
-    results: Dict[str, list],
+    results: Dict[str, np.ndarray],
     title: str = "Pendulum Simulation"
 ) -> None:
     """
@@ -49,7 +53,7 @@ def plot_results(
 
 
 def animate_pendulum(
-    results: Dict[str, list],
+    results: Dict[str, np.ndarray],
     length: float,
     interval: int = 20,
     save_path: Optional[str] = None
@@ -58,13 +62,23 @@ def animate_pendulum(
     Create animation of pendulum motion
     
     Args:
-        results: Simulation results
+        results: Simulation results with time, angle and angular_velocity
         length: Pendulum length
         interval: Frame interval in ms
         save_path: Optional path to save animation
     """
-    angles = np.array(results['angle'])
-    times = np.array(results['time'])
+    # No copies: run_simulation already returns arrays
+    angles = np.asarray(results['angle'])
+    times = np.asarray(results['time'])
+    
+    # Resample long runs to evenly spaced frames with a cubic Hermite
+    # interpolant of (angle, angular velocity), before any trig
+    if len(times) > ANIMATION_FRAMES:
+        spline = CubicHermiteSpline(
+            times, angles, np.asarray(results['angular_velocity'])
+        )
+        times = np.linspace(times[0], times[-1], ANIMATION_FRAMES)
+        angles = spline(times)
     
     # Convert polar to cartesian
     x = length * np.sin(angles)
@@ -84,6 +98,11 @@ def animate_pendulum(
     bob, = ax.plot([], [], 'ro', markersize=15)
     time_text = ax.text(0.05, 0.95, '', transform=ax.transAxes)
     
+    # Reused per frame instead of building new lists in update()
+    rod_x = np.zeros(2)
+    rod_y = np.zeros(2)
+    labels = [f'Time: {t:.2f}s' for t in times]
+    
     def init():
         rod.set_data([], [])
         bob.set_data([], [])
@@ -92,18 +111,16 @@ def animate_pendulum(
     
     def update(frame):
         # Rod connects origin (0,0) to bob (x,y)
-        rod.set_data([0, x[frame]], [0, y[frame]])
-        bob.set_data([x[frame]], [y[frame]])
-        time_text.set_text(f'Time: {times[frame]:.2f}s')
+        rod_x[1] = x[frame]
+        rod_y[1] = y[frame]
+        rod.set_data(rod_x, rod_y)
+        bob.set_data(x[frame:frame + 1], y[frame:frame + 1])
+        time_text.set_text(labels[frame])
         return rod, bob, time_text
     
-    # Downsample for smoother animation if needed
-    step = max(1, len(times) // 500)  # Limit to ~500 frames
-    frames = range(0, len(times), step)
-    
     anim = FuncAnimation(
         fig, update, init_func=init,
-        frames=frames, interval=interval,
+        frames=len(times), interval=interval,
         blit=True
     )
     
@@ -2,7 +2,10 @@
 import pytest
 import numpy as np
 from src.pendulum import Pendulum
-from src.simulator import rk4_step, run_simulation
+from src.simulator import (
+    rk4_step, run_simulation, run_simulation_adaptive, dopri5_step,
+    run_simulation_batched, run_simulation_torch, run_simulation_scipy
+)
 
 
 def test_rk4_step_updates_state():
@@ -30,6 +33,7 @@ def test_simulation_runs():
     assert len(results['time']) == expected_steps
     assert len(results['angle']) == expected_steps
     assert len(results['total_energy']) == expected_steps
+    assert results['angle'].dtype == np.float32
 
 
 def test_energy_conservation():
@@ -53,3 +57,102 @@ def test_damping_energy_loss():
     
     energies = results['total_energy']
     assert energies[-1] < energies[0]
+
+
+def test_simulation_matches_rk4_step():
+    """Test the compiled loop follows the same trajectory as rk4_step"""
+    p1 = Pendulum(angle=1.0, damping=0.1)
+    p2 = Pendulum(angle=1.0, damping=0.1)
+    
+    results = run_simulation(p1, duration=3.0, dt=0.01)
+    angles = []
+    for _ in range(len(results['time'])):
+        angles.append(p2.angle)
+        rk4_step(p2, dt=0.01)
+    
+    assert isinstance(results['angle'], np.ndarray)
+    assert np.allclose(results['angle'], angles)
+    assert pytest.approx(p1.angle) == p2.angle
+    assert pytest.approx(p1.angular_velocity) == p2.angular_velocity
+
+
+def test_dopri5_step_error_shrinks_with_step_size():
+    """Test the embedded error estimate falls as h**5"""
+    p = Pendulum(angle=1.0)
+    _, err_large, _ = dopri5_step(p, 0.2)
+    _, err_small, stages = dopri5_step(p, 0.1)
+    
+    assert err_small < err_large / 16
+    assert len(stages) == 7
+    assert p.angle == 1.0  # Attempted steps leave the pendulum untouched
+
+
+def test_adaptive_simulation_matches_fine_rk4():
+    """Test adaptive DOPRI5 samples agree with small fixed RK4 steps"""
+    p = Pendulum(angle=2.0, damping=0.1)
+    results = run_simulation_adaptive(p, duration=2.0, samples=21)
+    
+    ref = Pendulum(angle=2.0, damping=0.1)
+    expected = []
+    for i in range(2001):
+        if i % 100 == 0:
+            expected.append(ref.angle)
+        rk4_step(ref, dt=0.001)
+    
+    assert len(results['time']) == 21
+    assert results['angle'].dtype == np.float32
+    assert np.allclose(results['angle'], expected, atol=1e-5)
+    assert pytest.approx(p.angle, abs=1e-5) == expected[-1]
+
+
+def test_scipy_simulation_matches_fine_rk4():
+    """Test the solve_ivp wrapper agrees with small fixed RK4 steps"""
+    p = Pendulum(angle=1.0, damping=0.5)
+    results = run_simulation_scipy(p, duration=5.0, rtol=1e-9, samples=6)
+    
+    ref = Pendulum(angle=1.0, damping=0.5)
+    expected = []
+    for i in range(5001):
+        if i % 1000 == 0:
+            expected.append(ref.angle)
+        rk4_step(ref, dt=0.001)
+    
+    assert np.allclose(results['time'], np.linspace(0, 5.0, 6))
+    assert results['angle'].dtype == np.float32
+    assert np.allclose(results['angle'], expected, atol=1e-6)
+    assert pytest.approx(p.angle, abs=1e-6) == expected[-1]
+
+
+def test_batched_simulation_matches_individual_runs():
+    """Test the vectorized batch reproduces one run_simulation per pendulum"""
+    thetas = np.array([0.1, 0.5, 1.5])
+    omegas = np.array([0.0, 1.0, -0.5])
+    lengths = np.array([1.0, 2.0, 0.5])
+    dampings = np.array([0.0, 0.2, 0.5])
+    
+    batch = run_simulation_batched(
+        thetas, omegas, lengths, 2.0, dampings, duration=2.0, dt=0.01
+    )
+    
+    assert batch['angle'].shape == (200, 3)
+    assert batch['angle'].dtype == np.float32
+    for j in range(3):
+        p = Pendulum(length=lengths[j], mass=2.0, angle=thetas[j],
+                     angular_velocity=omegas[j], damping=dampings[j])
+        single = run_simulation(p, duration=2.0, dt=0.01)
+        assert np.allclose(batch['angle'][:, j], single['angle'])
+        assert np.allclose(batch['total_energy'][:, j], single['total_energy'])
+
+
+def test_torch_simulation_matches_batched():
+    """Test the torch integrator against the NumPy batch (on CPU)"""
+    pytest.importorskip("torch")
+    args = (np.array([0.1, 1.0]), np.array([0.0, 0.5]), 1.5, 1.0,
+            np.array([0.0, 0.3]))
+    
+    expected = run_simulation_batched(*args, duration=1.0, dt=0.01)
+    results = run_simulation_torch(*args, duration=1.0, dt=0.01, device='cpu')
+    
+    assert results['angle'].dtype == np.float32
+    assert np.allclose(results['angle'], expected['angle'])
+    assert np.allclose(results['total_energy'], expected['total_energy'])